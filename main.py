@@ -10,13 +10,13 @@ from typing import Optional
 from telebot.async_telebot import AsyncTeleBot
 from telebot import asyncio_helper
 
-from src.config import get_config
+from src.config import get_config, setup_logging
 from src.db.connection import DatabaseManager
 from src.db.table import initialize_tables
 from src.bot.application.context import BotContext, set_bot_context
 from src.bot.application.register_handlers import register_handlers
 
-# Логирование настраивается автоматически при загрузке конфигурации
+# Логирование настраивается один раз при запуске (см. __main__)
 logger = logging.getLogger(__name__)
 
 
@@ -110,6 +110,8 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    setup_logging()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
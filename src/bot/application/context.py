@@ -111,6 +111,7 @@ class BotContext:
                 person_repo=self.blacklist_person_repository,
                 record_repo=self.blacklist_record_repository,
                 history_repo=self.blacklist_history_repository,
+                admin_repo=self.admin_repository,
                 hash_service=self.hash_service,
             )
         return self._blacklist_service
@@ -24,6 +24,7 @@ class BlacklistPerson:
         phone_hash: Хеш телефона
         surname_hash: Хеш фамилии (для частичного поиска)
         phone_last10_hash: Хеш последних 10 цифр телефона
+        passport_lookup_hash: Хеш паспорта без соли организации (None у старых записей)
         created: Дата и время создания
         updated: Дата и время последнего обновления
     """
@@ -37,6 +38,7 @@ class BlacklistPerson:
     phone_hash: str
     surname_hash: Optional[str]
     phone_last10_hash: Optional[str]
+    passport_lookup_hash: Optional[str]
     created: datetime
     updated: datetime
     
@@ -63,6 +65,7 @@ class BlacklistPerson:
             phone_hash=row["phone_hash"],
             surname_hash=row.get("surname_hash"),
             phone_last10_hash=row.get("phone_last10_hash"),
+            passport_lookup_hash=row.get("passport_lookup_hash"),
             created=row["created"],
             updated=row["updated"],
         )
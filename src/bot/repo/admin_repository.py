@@ -2,7 +2,8 @@
 Репозиторий для работы с администраторами в базе данных.
 """
 import logging
-from typing import Optional
+from typing import Optional, Dict, Iterable
+from uuid import UUID
 
 from src.db.connection import DatabaseManager
 from src.bot.domain.admin import Admin
@@ -49,6 +50,35 @@ class AdminRepository:
             logger.error(f"Ошибка при получении администратора по admin_id {admin_id}: {e}", exc_info=True)
             raise
     
+    async def get_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Admin]:
+        """
+        Получить несколько администраторов по UUID одним запросом.
+        
+        Args:
+            ids: UUID администраторов
+            
+        Returns:
+            Словарь {UUID: Admin}; ненайденные UUID отсутствуют
+        """
+        ids = list(ids)
+        if not ids:
+            return {}
+        
+        try:
+            query = """
+                SELECT id, admin_id, role, created, updated
+                FROM admins
+                WHERE id = ANY($1::uuid[])
+            """
+            rows = await self.db_manager.fetch(query, ids)
+            
+            admins = [Admin.from_db_row(row) for row in rows]
+            return {admin.id: admin for admin in admins}
+            
+        except Exception as e:
+            logger.error(f"Ошибка при получении администраторов по id: {e}", exc_info=True)
+            raise
+    
     async def exists(self, admin_id: int) -> bool:
         """
         Проверить, существует ли администратор с указанным Telegram ID.
@@ -3,7 +3,7 @@
 Принцип единственной ответственности (SRP): только CRUD операции с blacklist_persons.
 """
 import logging
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 
 from src.db.connection import DatabaseManager
@@ -62,9 +62,10 @@ class BlacklistPersonRepository:
                     department_code_hash,
                     phone_hash,
                     surname_hash,
-                    phone_last10_hash
+                    phone_last10_hash,
+                    passport_lookup_hash
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
                 RETURNING *
             """
             
@@ -79,6 +80,7 @@ class BlacklistPersonRepository:
                 hashes.phone_hash,
                 hashes.surname_hash,
                 hashes.phone_last10_hash,
+                hashes.passport_lookup_hash,
             )
             
             if not row:
@@ -146,6 +148,50 @@ class BlacklistPersonRepository:
             logger.error(f"Ошибка при поиске по паспорту: {e}", exc_info=True)
             raise
     
+    async def find_by_passport_lookup_hash(
+        self,
+        passport_lookup_hash: str,
+        legacy_pairs: Sequence[tuple[int, str]],
+    ) -> List[BlacklistPerson]:
+        """
+        Найти пользователей по глобальному хешу паспорта одним запросом.
+        
+        Записи, созданные до появления passport_lookup_hash, ищутся по парам
+        (организация, хеш паспорта с солью организации) в том же запросе.
+        
+        Args:
+            passport_lookup_hash: Хеш паспорта без соли организации
+            legacy_pairs: Пары (organization_id, passport_hash) для старых записей
+            
+        Returns:
+            Список найденных пользователей в порядке организаций из legacy_pairs
+        """
+        try:
+            query = """
+                SELECT * FROM (
+                    SELECT * FROM blacklist_persons
+                    WHERE passport_lookup_hash = $1
+                    UNION ALL
+                    SELECT p.*
+                    FROM unnest($2::int[], $3::text[]) AS q(organization_id, passport_hash)
+                    JOIN blacklist_persons p
+                      ON p.organization_id = q.organization_id
+                     AND p.passport_hash = q.passport_hash
+                    WHERE p.passport_lookup_hash IS NULL
+                ) found
+                ORDER BY array_position($2::int[], found.organization_id)
+            """
+            
+            org_ids = [org_id for org_id, _ in legacy_pairs]
+            passport_hashes = [passport_hash for _, passport_hash in legacy_pairs]
+            
+            rows = await self._db.fetch(query, passport_lookup_hash, org_ids, passport_hashes)
+            return [BlacklistPerson.from_db_row(row) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Ошибка при глобальном поиске по паспорту: {e}", exc_info=True)
+            raise
+    
     async def find_by_fio_hash(
         self,
         organization_id: int,
@@ -192,7 +238,9 @@ class BlacklistPersonRepository:
         try:
             query = """
                 SELECT * FROM blacklist_persons
-                WHERE organization_id = $1 AND surname_hash = $2
+                WHERE organization_id = $1
+                  AND hash_prefix64(surname_hash) = hash_prefix64($2)
+                  AND surname_hash = $2
             """
             
             rows = await self._db.fetch(query, organization_id, surname_hash)
@@ -248,7 +296,9 @@ class BlacklistPersonRepository:
         try:
             query = """
                 SELECT * FROM blacklist_persons
-                WHERE organization_id = $1 AND phone_last10_hash = $2
+                WHERE organization_id = $1
+                  AND hash_prefix64(phone_last10_hash) = hash_prefix64($2)
+                  AND phone_last10_hash = $2
             """
             
             rows = await self._db.fetch(query, organization_id, phone_last10_hash)
@@ -419,47 +469,83 @@ class BlacklistPersonRepository:
             logger.error(f"Ошибка при получении уникальных солей: {e}", exc_info=True)
             raise
     
-    async def find_by_passport_hash_global(
+    async def find_by_passport_hashes_global(
         self,
-        passport_hash: str,
+        passport_hashes: Sequence[str],
+        organization_ids: Optional[List[int]] = None,
     ) -> List[BlacklistPerson]:
         """
-        Найти всех пользователей по хешу паспорта (глобальный поиск).
+        Найти всех пользователей по нескольким хешам паспорта одним запросом
+        (например, хешам одного значения с разными солями).
         
         Args:
-            passport_hash: Хеш паспорта
+            passport_hashes: Хеши паспорта
+            organization_ids: Ограничить поиск этими организациями (None — все)
             
         Returns:
-            Список найденных пользователей
+            Список найденных пользователей в порядке переданных хешей
         """
+        if not passport_hashes:
+            return []
+        
         try:
-            query = "SELECT * FROM blacklist_persons WHERE passport_hash = $1"
-            rows = await self._db.fetch(query, passport_hash)
+            if organization_ids is None:
+                query = """
+                    SELECT * FROM blacklist_persons
+                    WHERE passport_hash = ANY($1::text[])
+                    ORDER BY array_position($1::text[], passport_hash)
+                """
+                rows = await self._db.fetch(query, list(passport_hashes))
+            else:
+                query = """
+                    SELECT * FROM blacklist_persons
+                    WHERE passport_hash = ANY($1::text[]) AND organization_id = ANY($2::int[])
+                    ORDER BY array_position($1::text[], passport_hash)
+                """
+                rows = await self._db.fetch(query, list(passport_hashes), list(organization_ids))
             return [BlacklistPerson.from_db_row(row) for row in rows]
             
         except Exception as e:
-            logger.error(f"Ошибка при глобальном поиске по паспорту: {e}", exc_info=True)
+            logger.error(f"Ошибка при глобальном поиске по хешам паспорта: {e}", exc_info=True)
             raise
     
-    async def find_by_fio_hash_global(
+    async def find_by_fio_hashes_global(
         self,
-        fio_hash: str,
+        fio_hashes: Sequence[str],
+        organization_ids: Optional[List[int]] = None,
     ) -> List[BlacklistPerson]:
         """
-        Найти всех пользователей по хешу ФИО (глобальный поиск).
+        Найти всех пользователей по нескольким хешам ФИО одним запросом
+        (например, хешам одного значения с разными солями).
         
         Args:
-            fio_hash: Хеш ФИО
+            fio_hashes: Хеши ФИО
+            organization_ids: Ограничить поиск этими организациями (None — все)
             
         Returns:
-            Список найденных пользователей
+            Список найденных пользователей в порядке переданных хешей
         """
+        if not fio_hashes:
+            return []
+        
         try:
-            query = "SELECT * FROM blacklist_persons WHERE fio_hash = $1"
-            rows = await self._db.fetch(query, fio_hash)
+            if organization_ids is None:
+                query = """
+                    SELECT * FROM blacklist_persons
+                    WHERE fio_hash = ANY($1::text[])
+                    ORDER BY array_position($1::text[], fio_hash)
+                """
+                rows = await self._db.fetch(query, list(fio_hashes))
+            else:
+                query = """
+                    SELECT * FROM blacklist_persons
+                    WHERE fio_hash = ANY($1::text[]) AND organization_id = ANY($2::int[])
+                    ORDER BY array_position($1::text[], fio_hash)
+                """
+                rows = await self._db.fetch(query, list(fio_hashes), list(organization_ids))
             return [BlacklistPerson.from_db_row(row) for row in rows]
             
         except Exception as e:
-            logger.error(f"Ошибка при глобальном поиске по ФИО: {e}", exc_info=True)
+            logger.error(f"Ошибка при глобальном поиске по хешам ФИО: {e}", exc_info=True)
             raise
 
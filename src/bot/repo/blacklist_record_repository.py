@@ -3,11 +3,12 @@
 Принцип единственной ответственности (SRP): только CRUD операции с blacklist_records.
 """
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from src.db.connection import DatabaseManager
 from src.bot.domain.blacklist_record import BlacklistRecord, BlacklistStatus
+from src.bot.domain.blacklist_history import BlacklistAction
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +91,83 @@ class BlacklistRecordRepository:
             logger.error(f"Ошибка при создании записи в ЧС: {e}", exc_info=True)
             raise
     
+    async def create_with_history(
+        self,
+        person_id: UUID,
+        organization_id: int,
+        added_by_admin_id: UUID,
+        reason: str,
+        comment: Optional[str] = None,
+    ) -> BlacklistRecord:
+        """
+        Создать запись в черном списке и записать добавление в историю.
+        
+        Вставка записи и истории выполняются одним запросом (CTE):
+        один round-trip к БД и атомарность без явной транзакции.
+        
+        Args:
+            person_id: UUID обезличенного пользователя
+            organization_id: ID организации
+            added_by_admin_id: UUID админа
+            reason: Причина добавления
+            comment: Комментарий (опционально)
+            
+        Returns:
+            Созданная запись BlacklistRecord
+            
+        Raises:
+            Exception: При ошибке создания
+        """
+        try:
+            query = """
+                WITH created AS (
+                    INSERT INTO blacklist_records (
+                        person_id,
+                        organization_id,
+                        added_by_admin_id,
+                        reason,
+                        comment,
+                        status
+                    )
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    RETURNING *
+                ), history AS (
+                    INSERT INTO blacklist_history (
+                        blacklist_record_id,
+                        action,
+                        changed_by_admin_id,
+                        new_reason,
+                        new_status,
+                        comment
+                    )
+                    SELECT id, $7, $3, $4, $6, $5 FROM created
+                )
+                SELECT * FROM created
+            """
+            
+            row = await self._db.fetchrow(
+                query,
+                person_id,
+                organization_id,
+                added_by_admin_id,
+                reason,
+                comment,
+                BlacklistStatus.ACTIVE.value,
+                BlacklistAction.ADDED.value,
+            )
+            
+            if not row:
+                raise ValueError("Не удалось создать запись в черном списке")
+            
+            record = BlacklistRecord.from_db_row(row)
+            logger.info(f"Создана запись в ЧС: {record.id} для пользователя {person_id}")
+            
+            return record
+            
+        except Exception as e:
+            logger.error(f"Ошибка при создании записи в ЧС с историей: {e}", exc_info=True)
+            raise
+    
     async def get_by_id(self, record_id: UUID) -> Optional[BlacklistRecord]:
         """
         Получить запись по ID.
@@ -149,6 +227,42 @@ class BlacklistRecordRepository:
             logger.error(f"Ошибка при получении записей для {person_id}: {e}", exc_info=True)
             raise
     
+    async def get_by_person_ids(
+        self,
+        person_ids: Iterable[UUID],
+    ) -> Dict[UUID, List[BlacklistRecord]]:
+        """
+        Получить записи сразу для нескольких обезличенных пользователей.
+        
+        Args:
+            person_ids: UUID пользователей
+            
+        Returns:
+            Словарь {person_id: список записей (от новых к старым)};
+            пользователи без записей получают пустой список
+        """
+        ids = list(set(person_ids))
+        if not ids:
+            return {}
+        
+        try:
+            query = """
+                SELECT * FROM blacklist_records
+                WHERE person_id = ANY($1::uuid[])
+                ORDER BY created DESC
+            """
+            rows = await self._db.fetch(query, ids)
+            
+            records_by_person: Dict[UUID, List[BlacklistRecord]] = {person_id: [] for person_id in ids}
+            for row in rows:
+                record = BlacklistRecord.from_db_row(row)
+                records_by_person.setdefault(record.person_id, []).append(record)
+            return records_by_person
+            
+        except Exception as e:
+            logger.error(f"Ошибка при получении записей для {len(ids)} пользователей: {e}", exc_info=True)
+            raise
+    
     async def get_by_organization(
         self,
         organization_id: int,
@@ -238,7 +352,7 @@ class BlacklistRecordRepository:
         try:
             query = """
                 UPDATE blacklist_records
-                SET status = $2
+                SET status = $2, updated = NOW()
                 WHERE id = $1
                 RETURNING *
             """
@@ -275,7 +389,7 @@ class BlacklistRecordRepository:
         try:
             query = """
                 UPDATE blacklist_records
-                SET reason = $2, comment = $3
+                SET reason = $2, comment = $3, updated = NOW()
                 WHERE id = $1
                 RETURNING *
             """
@@ -316,6 +430,129 @@ class BlacklistRecordRepository:
         """
         return await self.update_status(record_id, BlacklistStatus.ACTIVE)
     
+    async def update_status_with_history(
+        self,
+        record_id: UUID,
+        new_status: BlacklistStatus,
+        old_status: BlacklistStatus,
+        action: BlacklistAction,
+        admin_id: UUID,
+        comment: Optional[str] = None,
+    ) -> Optional[BlacklistRecord]:
+        """
+        Обновить статус записи и записать изменение в историю.
+        
+        Обновление и запись истории выполняются одним запросом (CTE):
+        один round-trip к БД и атомарность без явной транзакции.
+        История пишется только если запись найдена.
+        
+        Args:
+            record_id: UUID записи
+            new_status: Новый статус
+            old_status: Предыдущий статус (для истории)
+            action: Тип действия для истории
+            admin_id: UUID админа
+            comment: Комментарий для истории
+            
+        Returns:
+            Обновленная запись или None
+        """
+        try:
+            query = """
+                WITH updated AS (
+                    UPDATE blacklist_records
+                    SET status = $2, updated = NOW()
+                    WHERE id = $1
+                    RETURNING *
+                ), history AS (
+                    INSERT INTO blacklist_history (
+                        blacklist_record_id,
+                        action,
+                        changed_by_admin_id,
+                        old_status,
+                        new_status,
+                        comment
+                    )
+                    SELECT id, $3, $4, $5, $2, $6 FROM updated
+                )
+                SELECT * FROM updated
+            """
+            
+            row = await self._db.fetchrow(
+                query,
+                record_id,
+                new_status.value,
+                action.value,
+                admin_id,
+                old_status.value,
+                comment,
+            )
+            
+            if row:
+                record = BlacklistRecord.from_db_row(row)
+                logger.info(f"Обновлен статус записи {record_id}: {new_status.value} ({action.value})")
+                return record
+            return None
+            
+        except Exception as e:
+            logger.error(
+                f"Ошибка при обновлении статуса записи {record_id} с историей: {e}",
+                exc_info=True
+            )
+            raise
+    
+    async def deactivate_with_history(
+        self,
+        record_id: UUID,
+        admin_id: UUID,
+        comment: Optional[str] = None,
+    ) -> Optional[BlacklistRecord]:
+        """
+        Деактивировать запись и записать деактивацию в историю.
+        
+        Args:
+            record_id: UUID записи
+            admin_id: UUID админа
+            comment: Комментарий/причина деактивации
+            
+        Returns:
+            Деактивированная запись или None
+        """
+        return await self.update_status_with_history(
+            record_id,
+            new_status=BlacklistStatus.INACTIVE,
+            old_status=BlacklistStatus.ACTIVE,
+            action=BlacklistAction.DEACTIVATED,
+            admin_id=admin_id,
+            comment=comment,
+        )
+    
+    async def reactivate_with_history(
+        self,
+        record_id: UUID,
+        admin_id: UUID,
+        comment: Optional[str] = None,
+    ) -> Optional[BlacklistRecord]:
+        """
+        Реактивировать запись и записать реактивацию в историю.
+        
+        Args:
+            record_id: UUID записи
+            admin_id: UUID админа
+            comment: Комментарий/причина реактивации
+            
+        Returns:
+            Реактивированная запись или None
+        """
+        return await self.update_status_with_history(
+            record_id,
+            new_status=BlacklistStatus.ACTIVE,
+            old_status=BlacklistStatus.INACTIVE,
+            action=BlacklistAction.REACTIVATED,
+            admin_id=admin_id,
+            comment=comment,
+        )
+    
     async def count_by_organization(
         self,
         organization_id: int,
@@ -4,7 +4,7 @@
 """
 import logging
 import secrets
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 
 from src.db.connection import DatabaseManager
 from src.bot.domain.organization import Organization
@@ -104,6 +104,34 @@ class OrganizationRepository:
             logger.error(f"Ошибка при получении организации {org_id}: {e}", exc_info=True)
             raise
     
+    async def get_by_ids(self, org_ids: Iterable[int]) -> Dict[int, Organization]:
+        """
+        Получить несколько организаций одним запросом.
+        
+        Args:
+            org_ids: ID организаций
+            
+        Returns:
+            Словарь {id: Organization} (отсутствующие ID не попадают в словарь)
+        """
+        ids = list(set(org_ids))
+        if not ids:
+            return {}
+        
+        try:
+            query = """
+                SELECT id, name, hash_salt, created, updated
+                FROM organizations
+                WHERE id = ANY($1::int[])
+            """
+            
+            rows = await self._db.fetch(query, ids)
+            return {row["id"]: Organization.from_db_row(row) for row in rows}
+            
+        except Exception as e:
+            logger.error(f"Ошибка при получении организаций {ids}: {e}", exc_info=True)
+            raise
+    
     async def get_by_name(self, name: str) -> Optional[Organization]:
         """
         Получить организацию по названию.
@@ -166,7 +194,7 @@ class OrganizationRepository:
         try:
             query = """
                 UPDATE organizations
-                SET name = $2
+                SET name = $2, updated = NOW()
                 WHERE id = $1
                 RETURNING id, name, hash_salt, created, updated
             """
@@ -7,9 +7,11 @@
 - OCP: Расширяемость через новые методы поиска
 - DIP: Зависит от абстракций (репозиториев), а не от конкретных реализаций
 """
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from src.bot.domain.organization import Organization
@@ -20,6 +22,7 @@ from src.bot.repo.organization_repository import OrganizationRepository
 from src.bot.repo.blacklist_person_repository import BlacklistPersonRepository
 from src.bot.repo.blacklist_record_repository import BlacklistRecordRepository
 from src.bot.repo.blacklist_history_repository import BlacklistHistoryRepository
+from src.bot.repo.admin_repository import AdminRepository
 from src.bot.service.hash_service import HashService, PersonalData, PersonHashes
 
 logger = logging.getLogger(__name__)
@@ -65,18 +68,54 @@ class BlacklistSearchResult:
             self.records = []
 
 
+@dataclass(slots=True)
+class SearchHashes:
+    """
+    Хеши критериев поиска, вычисленные с одной солью.
+    
+    Attributes:
+        passport: Хеш паспорта
+        department_code: Хеш кода подразделения
+        birthdate: Хеш даты рождения
+        phone: Хеш телефона
+        fio: Хеш ФИО
+        
+    None — критерий не указан (или не нужен для проверки).
+    """
+    passport: Optional[str] = None
+    department_code: Optional[str] = None
+    birthdate: Optional[str] = None
+    phone: Optional[str] = None
+    fio: Optional[str] = None
+
+
 class BlacklistService:
     """
     Сервис для работы с черным списком.
     Координирует работу репозиториев и хеш-сервиса.
     """
     
+    # Время жизни кеша организаций (секунды).
+    # Организации меняются редко, а список нужен на каждом добавлении/поиске.
+    ORGS_CACHE_TTL = 60.0
+    
+    # Время жизни кеша уникальных солей (секунды).
+    # Новая соль появляется только при первом добавлении в ЧС от организации.
+    SALTS_CACHE_TTL = 60.0
+    
+    # Время жизни кеша информации об админах (секунды)
+    ADMINS_CACHE_TTL = 300.0
+    
+    # Максимальное число админов в кеше
+    ADMINS_CACHE_MAX_SIZE = 1024
+    
     def __init__(
         self,
         organization_repo: OrganizationRepository,
         person_repo: BlacklistPersonRepository,
         record_repo: BlacklistRecordRepository,
         history_repo: BlacklistHistoryRepository,
+        admin_repo: AdminRepository,
         hash_service: HashService,
     ):
         """
@@ -87,17 +126,124 @@ class BlacklistService:
             person_repo: Репозиторий обезличенных пользователей
             record_repo: Репозиторий записей ЧС
             history_repo: Репозиторий истории
+            admin_repo: Репозиторий администраторов
             hash_service: Сервис хеширования
         """
         self._org_repo = organization_repo
         self._person_repo = person_repo
         self._record_repo = record_repo
         self._history_repo = history_repo
+        self._admin_repo = admin_repo
         self._hash_service = hash_service
+        
+        # Кеш организаций: (момент истечения, {id: Organization})
+        self._orgs_cache: Optional[tuple[float, Dict[int, Organization]]] = None
+        self._orgs_lock = asyncio.Lock()
+        
+        # Кеш уникальных солей: (момент истечения, [соль, ...])
+        self._salts_cache: Optional[tuple[float, List[str]]] = None
+        self._salts_lock = asyncio.Lock()
+        
+        # Кеш информации об админах: {UUID: (момент истечения, информация)},
+        # не больше ADMINS_CACHE_MAX_SIZE записей в порядке записи
+        self._admins_cache: Dict[UUID, tuple[float, dict]] = {}
+    
+    async def _get_orgs_map(self) -> Dict[int, Organization]:
+        """
+        Получить все организации из кеша (с загрузкой из БД при истечении TTL).
+        
+        Бот не создаёт и не переименовывает организации, поэтому кеш не
+        сбрасывается: изменения, внесённые в БД напрямую, видны в результатах
+        поиска не позже чем через ORGS_CACHE_TTL секунд.
+        
+        Returns:
+            Словарь {id: Organization} в порядке, возвращаемом репозиторием
+        """
+        cache = self._orgs_cache
+        if cache is not None and cache[0] > time.monotonic():
+            return cache[1]
+        
+        async with self._orgs_lock:
+            # Кеш мог быть заполнен, пока ждали блокировку
+            cache = self._orgs_cache
+            if cache is not None and cache[0] > time.monotonic():
+                return cache[1]
+            
+            orgs = await self._org_repo.get_all()
+            orgs_map = {org.id: org for org in orgs}
+            self._orgs_cache = (time.monotonic() + self.ORGS_CACHE_TTL, orgs_map)
+            return orgs_map
+    
+    async def _get_organizations(self) -> List[Organization]:
+        """
+        Получить все организации (с кешированием).
+        
+        Returns:
+            Список организаций
+        """
+        return list((await self._get_orgs_map()).values())
+    
+    async def _get_organization(self, org_id: int) -> Optional[Organization]:
+        """
+        Получить организацию по ID (с кешированием).
+        
+        Args:
+            org_id: ID организации
+            
+        Returns:
+            Организация или None
+        """
+        org = (await self._get_orgs_map()).get(org_id)
+        if org is None:
+            # Организация могла появиться после заполнения кеша
+            org = await self._org_repo.get_by_id(org_id)
+        return org
+    
+    async def _get_organizations_by_ids(self, org_ids: Iterable[int]) -> Dict[int, Organization]:
+        """
+        Получить несколько организаций по ID (с кешированием).
+        Отсутствующие в кеше организации загружаются одним запросом.
+        
+        Args:
+            org_ids: ID организаций
+            
+        Returns:
+            Словарь {id: Organization}
+        """
+        org_ids = set(org_ids)
+        orgs_map = await self._get_orgs_map()
+        result = {org_id: orgs_map[org_id] for org_id in org_ids if org_id in orgs_map}
+        
+        missing = [org_id for org_id in org_ids if org_id not in result]
+        if missing:
+            result.update(await self._org_repo.get_by_ids(missing))
+        return result
+    
+    async def _get_unique_salts(self) -> List[str]:
+        """
+        Получить уникальные соли из записей ЧС (с кешированием).
+        
+        Returns:
+            Список уникальных солей
+        """
+        cache = self._salts_cache
+        if cache is not None and cache[0] > time.monotonic():
+            return cache[1]
+        
+        async with self._salts_lock:
+            # Кеш мог быть заполнен, пока ждали блокировку
+            cache = self._salts_cache
+            if cache is not None and cache[0] > time.monotonic():
+                return cache[1]
+            
+            salts = await self._person_repo.get_unique_salts()
+            self._salts_cache = (time.monotonic() + self.SALTS_CACHE_TTL, salts)
+            return salts
     
     async def find_existing_person_across_orgs(
         self,
         personal_data: PersonalData,
+        preferred_org_id: Optional[int] = None,
     ) -> Optional[BlacklistPerson]:
         """
         Поиск существующего пользователя по всем организациям.
@@ -112,57 +258,67 @@ class BlacklistService:
         
         Args:
             personal_data: Персональные данные для поиска
+            preferred_org_id: Организация, кандидаты из которой проверяются первыми
             
         Returns:
             BlacklistPerson если найден, иначе None
         """
         try:
             # Получаем все организации
-            all_orgs = await self._org_repo.get_all()
+            all_orgs = await self._get_organizations()
             
             if not all_orgs:
                 logger.debug("Нет организаций для поиска")
                 return None
             
-            # Для каждой организации ищем по паспорту
-            for org in all_orgs:
-                # Вычисляем хеш паспорта с солью этой организации
-                passport_hash = self._hash_service.compute_search_hash(
-                    "passport", personal_data.passport, org.hash_salt
-                )
-                
-                # Шаг 1: Ищем по паспорту
-                person = await self._person_repo.find_by_passport_hash(
-                    organization_id=org.id,
-                    passport_hash=passport_hash,
-                )
-                
-                if not person:
-                    # Паспорт не найден в этой организации — продолжаем поиск в других
-                    continue
-                
+            if preferred_org_id is not None:
+                # Чаще всего пользователя повторно добавляют в той же организации —
+                # её кандидаты идут первыми (результаты упорядочены по организациям)
+                all_orgs.sort(key=lambda org: org.id != preferred_org_id)
+            
+            # Шаг 1: ищем паспорт одним запросом по глобальному хешу.
+            # Для старых записей без passport_lookup_hash — по хешам с солью
+            # каждой организации (в том же запросе)
+            lookup_hash = self._hash_service.compute_passport_lookup_hash(
+                personal_data.passport
+            )
+            # Организации с одинаковой солью дают одинаковый хеш — считаем его один раз
+            salts = list(dict.fromkeys(org.hash_salt for org in all_orgs))
+            hash_by_salt = dict(zip(
+                salts,
+                self._hash_service.compute_search_hashes_batch(
+                    "passport", personal_data.passport, salts
+                ),
+            ))
+            legacy_pairs = [(org.id, hash_by_salt[org.hash_salt]) for org in all_orgs]
+            candidates = await self._person_repo.find_by_passport_lookup_hash(
+                lookup_hash, legacy_pairs
+            )
+            
+            for person in candidates:
                 # Паспорт найден! Теперь проверяем код подразделения
+                # (хеши считаем с солью, которой была захеширована сама запись)
                 dept_hash = self._hash_service.compute_search_hash(
-                    "department_code", personal_data.department_code, org.hash_salt
+                    "department_code", personal_data.department_code, person.hash_salt
                 )
                 
                 if person.department_code_hash == dept_hash:
                     # Код подразделения совпал — это тот же человек
                     logger.info(
-                        f"Найден пользователь {person.id} в org={org.id} "
+                        f"Найден пользователь {person.id} в org={person.organization_id} "
                         f"(паспорт + код подразделения)"
                     )
                     return person
                 
                 # Код подразделения не совпал — проверяем дату рождения
                 birthdate_hash = self._hash_service.compute_search_hash(
-                    "birthdate", personal_data.birthdate, org.hash_salt
+                    "birthdate", personal_data.birthdate, person.hash_salt
                 )
                 
                 if person.birthdate_hash == birthdate_hash:
                     # Дата рождения совпала — это тот же человек
                     logger.info(
-                        f"Найден пользователь {person.id} в org={org.id} "
+                        f"Найден пользователь {person.id} в org={person.organization_id} "
                         f"(паспорт + дата рождения)"
                     )
                     return person
@@ -170,7 +326,7 @@ class BlacklistService:
                 # Ни код подразделения, ни дата рождения не совпали
                 # Паспорт совпал, но это может быть ошибка ввода — продолжаем поиск
                 logger.debug(
-                    f"Паспорт совпал в org={org.id}, но код подразделения и "
+                    f"Паспорт совпал в org={person.organization_id}, но код подразделения и "
                     f"дата рождения не совпали — продолжаем поиск"
                 )
             
@@ -208,7 +364,7 @@ class BlacklistService:
         """
         try:
             # Получаем организацию для соли
-            organization = await self._org_repo.get_by_id(organization_id)
+            organization = await self._get_organization(organization_id)
             if not organization:
                 return BlacklistAddResult(
                     success=False,
@@ -219,6 +375,7 @@ class BlacklistService:
             # Алгоритм: паспорт обязателен + (код подразделения ИЛИ дата рождения)
             existing_person = await self.find_existing_person_across_orgs(
                 personal_data=personal_data,
+                preferred_org_id=organization_id,
             )
             
             person: Optional[BlacklistPerson] = None
@@ -250,13 +407,19 @@ class BlacklistService:
                     hashes
                 )
                 
+                # Только что созданный пользователь не может иметь активных записей —
+                # проверяем лишь уже существовавшего
                 if not person_created:
                     # Пользователь уже был в текущей организации
                     existing_active = await self._record_repo.get_active_by_person(person.id)
                     already_exists = existing_active is not None
+                elif self._salts_cache is not None and organization.hash_salt not in self._salts_cache[1]:
+                    # Первая запись с солью этой организации — сбрасываем кеш солей,
+                    # иначе поиск по критериям не увидит её до истечения TTL
+                    self._salts_cache = None
             
-            # Создаем запись в ЧС
-            record = await self._record_repo.create(
+            # Создаем запись в ЧС и запись истории — одним запросом
+            record = await self._record_repo.create_with_history(
                 person_id=person.id,
                 organization_id=organization_id,
                 added_by_admin_id=admin_id,
@@ -264,14 +427,6 @@ class BlacklistService:
                 comment=comment,
             )
             
-            # Записываем в историю
-            await self._history_repo.log_added(
-                blacklist_record_id=record.id,
-                admin_id=admin_id,
-                reason=reason,
-                comment=comment,
-            )
-            
             logger.info(
                 f"Добавлена запись в ЧС: org={organization_id}, "
                 f"person={person.id}, record={record.id}, "
@@ -308,7 +463,7 @@ class BlacklistService:
             BlacklistSearchResult
         """
         try:
-            organization = await self._org_repo.get_by_id(organization_id)
+            organization = await self._get_organization(organization_id)
             if not organization:
                 return BlacklistSearchResult(found=False)
             
@@ -328,9 +483,9 @@ class BlacklistService:
             if not person:
                 return BlacklistSearchResult(found=False)
             
-            # Получаем записи
+            # Получаем записи; активную берём из них же, без второго запроса
             records = await self._record_repo.get_by_person_id(person.id)
-            active_record = await self._record_repo.get_active_by_person(person.id)
+            active_record = self._find_active_record(records)
             
             return BlacklistSearchResult(
                 found=True,
@@ -360,7 +515,7 @@ class BlacklistService:
             Список BlacklistSearchResult
         """
         try:
-            organization = await self._org_repo.get_by_id(organization_id)
+            organization = await self._get_organization(organization_id)
             if not organization:
                 return []
             
@@ -377,19 +532,7 @@ class BlacklistService:
                 phone_hash
             )
             
-            results = []
-            for person in persons:
-                records = await self._record_repo.get_by_person_id(person.id)
-                active_record = await self._record_repo.get_active_by_person(person.id)
-                
-                results.append(BlacklistSearchResult(
-                    found=True,
-                    person=person,
-                    records=records,
-                    active_record=active_record,
-                ))
-            
-            return results
+            return await self._build_search_results(persons)
             
         except Exception as e:
             logger.error(f"Ошибка при поиске по телефону: {e}", exc_info=True)
@@ -412,7 +555,7 @@ class BlacklistService:
             Список BlacklistSearchResult
         """
         try:
-            organization = await self._org_repo.get_by_id(organization_id)
+            organization = await self._get_organization(organization_id)
             if not organization:
                 return []
             
@@ -429,24 +572,108 @@ class BlacklistService:
                 surname_hash
             )
             
-            results = []
-            for person in persons:
-                records = await self._record_repo.get_by_person_id(person.id)
-                active_record = await self._record_repo.get_active_by_person(person.id)
-                
-                results.append(BlacklistSearchResult(
-                    found=True,
-                    person=person,
-                    records=records,
-                    active_record=active_record,
-                ))
-            
-            return results
+            return await self._build_search_results(persons)
             
         except Exception as e:
             logger.error(f"Ошибка при поиске по фамилии: {e}", exc_info=True)
             return []
     
+    @staticmethod
+    def _match_by_passport(person: BlacklistPerson, hashes: SearchHashes) -> List[str]:
+        """
+        Собрать совпавшие поля для пользователя, найденного по паспорту.
+        
+        Args:
+            person: Найденный пользователь
+            hashes: Хеши критериев поиска с солью пользователя
+            
+        Returns:
+            Названия совпавших полей (паспорт — всегда первым)
+        """
+        matched_fields = ['Паспорт']
+        
+        if hashes.department_code is not None and person.department_code_hash == hashes.department_code:
+            matched_fields.append('Код подразделения')
+        
+        if hashes.birthdate is not None and person.birthdate_hash == hashes.birthdate:
+            matched_fields.append('Дата рождения')
+        
+        if hashes.phone is not None and person.phone_hash == hashes.phone:
+            matched_fields.append('Телефон')
+        
+        if hashes.fio is not None and person.fio_hash == hashes.fio:
+            matched_fields.append('ФИО')
+        
+        return matched_fields
+    
+    @staticmethod
+    def _match_by_fio(person: BlacklistPerson, hashes: SearchHashes) -> List[str]:
+        """
+        Собрать совпавшие поля для пользователя, найденного по ФИО.
+        
+        Args:
+            person: Найденный пользователь
+            hashes: Хеши критериев поиска с солью пользователя
+            
+        Returns:
+            Названия совпавших полей (ФИО — всегда первым)
+        """
+        matched_fields = ['ФИО']
+        
+        if hashes.birthdate is not None and person.birthdate_hash == hashes.birthdate:
+            matched_fields.append('Дата рождения')
+        
+        if hashes.phone is not None and person.phone_hash == hashes.phone:
+            matched_fields.append('Телефон')
+        
+        if hashes.department_code is not None and person.department_code_hash == hashes.department_code:
+            matched_fields.append('Код подразделения')
+        
+        return matched_fields
+    
+    @staticmethod
+    def _find_active_record(records: List[BlacklistRecord]) -> Optional[BlacklistRecord]:
+        """
+        Найти активную запись среди записей пользователя.
+        
+        Args:
+            records: Записи пользователя (от новых к старым)
+            
+        Returns:
+            Самая свежая активная запись или None
+        """
+        return next((r for r in records if r.status == BlacklistStatus.ACTIVE), None)
+    
+    async def _build_search_results(
+        self,
+        persons: List[BlacklistPerson],
+    ) -> List[BlacklistSearchResult]:
+        """
+        Собрать результаты поиска для найденных пользователей.
+        Записи всех пользователей загружаются одним запросом.
+        
+        Args:
+            persons: Найденные пользователи
+            
+        Returns:
+            Список BlacklistSearchResult
+        """
+        if not persons:
+            return []
+        
+        records_by_person = await self._record_repo.get_by_person_ids(p.id for p in persons)
+        
+        results = []
+        for person in persons:
+            records = records_by_person.get(person.id, [])
+            results.append(BlacklistSearchResult(
+                found=True,
+                person=person,
+                records=records,
+                active_record=self._find_active_record(records),
+            ))
+        return results
+    
     async def deactivate_record(
         self,
         record_id: UUID,
@@ -465,14 +692,14 @@ class BlacklistService:
             Деактивированная запись или None
         """
         try:
-            record = await self._record_repo.deactivate(record_id)
+            # Смена статуса и запись истории — одним запросом
+            record = await self._record_repo.deactivate_with_history(
+                record_id,
+                admin_id=admin_id,
+                comment=comment,
+            )
             
             if record:
-                await self._history_repo.log_deactivated(
-                    blacklist_record_id=record_id,
-                    admin_id=admin_id,
-                    comment=comment,
-                )
                 logger.info(f"Запись {record_id} деактивирована админом {admin_id}")
             
             return record
@@ -499,14 +726,14 @@ class BlacklistService:
             Реактивированная запись или None
         """
         try:
-            record = await self._record_repo.reactivate(record_id)
+            # Смена статуса и запись истории — одним запросом
+            record = await self._record_repo.reactivate_with_history(
+                record_id,
+                admin_id=admin_id,
+                comment=comment,
+            )
             
             if record:
-                await self._history_repo.log_reactivated(
-                    blacklist_record_id=record_id,
-                    admin_id=admin_id,
-                    comment=comment,
-                )
                 logger.info(f"Запись {record_id} реактивирована админом {admin_id}")
             
             return record
@@ -537,6 +764,7 @@ class BlacklistService:
         birthdate: Optional[str] = None,
         department_code: Optional[str] = None,
         phone: Optional[str] = None,
+        organization_ids: Optional[List[int]] = None,
     ) -> List[dict]:
         """
         Поиск в черном списке по комбинации критериев.
@@ -555,6 +783,7 @@ class BlacklistService:
             birthdate: Дата рождения (ISO формат)
             department_code: Код подразделения (6 цифр)
             phone: Телефон (нормализованный)
+            organization_ids: Искать только в этих организациях (None — во всех)
             
         Returns:
             Список словарей с информацией о найденных записях
@@ -562,125 +791,99 @@ class BlacklistService:
         try:
             results = []
             
+            criteria = {
+                'passport': passport,
+                'department_code': department_code,
+                'birthdate': birthdate,
+                'phone': phone,
+                'fio': fio,
+            }
+            provided = {field: value for field, value in criteria.items() if value}
+            
+            # Нужно минимум 2 совпадения, а поиск идёт по паспорту или ФИО —
+            # при меньшем наборе критериев найти ничего нельзя, не обращаемся к БД
+            if len(provided) < 2 or not (passport or fio):
+                logger.debug("Недостаточно критериев для поиска")
+                return []
+            
             # Оптимизация: получаем только уникальные соли из существующих записей
             # вместо перебора всех организаций
-            unique_salts = await self._person_repo.get_unique_salts()
+            unique_salts = await self._get_unique_salts()
             
             if not unique_salts:
                 logger.debug("Нет записей в ЧС для поиска")
                 return []
             
             # Собираем все найденные person_ids с информацией о совпадениях
-            found_persons = {}  # {person_id: {'person': ..., 'matched_fields': [...]}}
+            found_persons = {}  # {person_id: (число совпадений, person, matched_fields)}
             
-            for salt in unique_salts:
-                # Вычисляем хеши с текущей солью
-                hashes = {}
+            # Поиск по паспорту (самый уникальный идентификатор), а если паспорт
+            # не указан — по ФИО. Хеши всех солей проверяются одним запросом.
+            probe_field = 'passport' if passport else 'fio'
+            probe_hashes = self._hash_service.compute_search_hashes_batch(
+                probe_field, provided[probe_field], unique_salts
+            )
+            if passport:
+                persons = await self._person_repo.find_by_passport_hashes_global(
+                    probe_hashes, organization_ids
+                )
+            else:
+                persons = await self._person_repo.find_by_fio_hashes_global(
+                    probe_hashes, organization_ids
+                )
+            
+            # Хеши остальных полей считаем только для солей, по которым нашлись
+            # совпадения, — для той соли, чей хеш совпал
+            salt_by_probe = dict(zip(probe_hashes, unique_salts))
+            hashes_by_salt: Dict[str, SearchHashes] = {}
+            
+            for person in persons:
+                salt = salt_by_probe[person.passport_hash if passport else person.fio_hash]
+                hashes = hashes_by_salt.get(salt)
+                if hashes is None:
+                    hashes = SearchHashes(**{
+                        field: self._hash_service.compute_search_hash(field, value, salt)
+                        for field, value in provided.items()
+                        if field != probe_field
+                    })
+                    hashes_by_salt[salt] = hashes
                 
                 if passport:
-                    hashes['passport'] = self._hash_service.compute_search_hash(
-                        "passport", passport, salt
-                    )
-                
-                if department_code:
-                    hashes['department_code'] = self._hash_service.compute_search_hash(
-                        "department_code", department_code, salt
-                    )
-                
-                if birthdate:
-                    hashes['birthdate'] = self._hash_service.compute_search_hash(
-                        "birthdate", birthdate, salt
-                    )
-                
-                if phone:
-                    hashes['phone'] = self._hash_service.compute_search_hash(
-                        "phone", phone, salt
-                    )
-                
-                if fio:
-                    hashes['fio'] = self._hash_service.compute_search_hash(
-                        "fio", fio, salt
-                    )
+                    matched_fields = self._match_by_passport(person, hashes)
+                else:
+                    # Паспорт не указан — ФИО + дата рождения / телефон / код подразделения
+                    matched_fields = self._match_by_fio(person, hashes)
                 
-                # Поиск по паспорту (самый уникальный идентификатор)
-                if 'passport' in hashes:
-                    persons = await self._person_repo.find_by_passport_hash_global(
-                        hashes['passport']
-                    )
-                    
-                    for person in persons:
-                        matched_fields = ['Паспорт']
-                        
-                        # Проверяем дополнительные совпадения
-                        if 'department_code' in hashes and person.department_code_hash == hashes['department_code']:
-                            matched_fields.append('Код подразделения')
-                        
-                        if 'birthdate' in hashes and person.birthdate_hash == hashes['birthdate']:
-                            matched_fields.append('Дата рождения')
-                        
-                        if 'phone' in hashes and person.phone_hash and person.phone_hash == hashes['phone']:
-                            matched_fields.append('Телефон')
-                        
-                        if 'fio' in hashes and person.fio_hash == hashes['fio']:
-                            matched_fields.append('ФИО')
-                        
-                        # Нужно минимум 2 совпадения
-                        if len(matched_fields) >= 2:
-                            if person.id not in found_persons:
-                                found_persons[person.id] = {
-                                    'person': person,
-                                    'matched_fields': matched_fields,
-                                }
-                            elif len(matched_fields) > len(found_persons[person.id]['matched_fields']):
-                                found_persons[person.id] = {
-                                    'person': person,
-                                    'matched_fields': matched_fields,
-                                }
-                
-                # Если паспорт не указан, ищем по ФИО + дата рождения или ФИО + телефон
-                if 'fio' in hashes and 'passport' not in hashes:
-                    persons = await self._person_repo.find_by_fio_hash_global(hashes['fio'])
-                    
-                    for person in persons:
-                        matched_fields = ['ФИО']
-                        
-                        if 'birthdate' in hashes and person.birthdate_hash == hashes['birthdate']:
-                            matched_fields.append('Дата рождения')
-                        
-                        if 'phone' in hashes and person.phone_hash and person.phone_hash == hashes['phone']:
-                            matched_fields.append('Телефон')
-                        
-                        if 'department_code' in hashes and person.department_code_hash == hashes['department_code']:
-                            matched_fields.append('Код подразделения')
-                        
-                        # Нужно минимум 2 совпадения
-                        if len(matched_fields) >= 2:
-                            if person.id not in found_persons:
-                                found_persons[person.id] = {
-                                    'person': person,
-                                    'matched_fields': matched_fields,
-                                }
-                            elif len(matched_fields) > len(found_persons[person.id]['matched_fields']):
-                                found_persons[person.id] = {
-                                    'person': person,
-                                    'matched_fields': matched_fields,
-                                }
-            
-            # Для каждого найденного пользователя получаем записи ЧС
-            for person_data in found_persons.values():
-                person = person_data['person']
-                matched_fields = person_data['matched_fields']
-                
-                # Получаем информацию об организации через person.organization_id
-                org = await self._org_repo.get_by_id(person.organization_id)
+                # Нужно минимум 2 совпадения; оставляем вариант с наибольшим числом
+                count = len(matched_fields)
+                if count >= 2:
+                    current = found_persons.get(person.id)
+                    if current is None or count > current[0]:
+                        found_persons[person.id] = (count, person, matched_fields)
+            
+            # Организации всех найденных пользователей — одним обращением
+            orgs = await self._get_organizations_by_ids(
+                {person.organization_id for _, person, _ in found_persons.values()}
+            )
+            
+            # Записи ЧС всех найденных пользователей — одним запросом
+            records_by_person = await self._record_repo.get_by_person_ids(found_persons.keys())
+            person_records = [
+                (person, matched_fields, records_by_person.get(person_id, []))
+                for person_id, (_, person, matched_fields) in found_persons.items()
+            ]
+            
+            # Информация об админах всех записей — одним запросом
+            admins = await self._get_admins_info(
+                {record.added_by_admin_id for _, _, records in person_records for record in records}
+            )
+            
+            for person, matched_fields, records in person_records:
+                org = orgs.get(person.organization_id)
                 org_name = org.name if org else "Неизвестно"
                 
-                # Получаем записи ЧС
-                records = await self._record_repo.get_by_person_id(person.id)
-                
                 for record in records:
-                    # Получаем информацию об админе
-                    admin = await self._get_admin_info(record.added_by_admin_id)
+                    admin = admins.get(record.added_by_admin_id, {})
                     
                     results.append({
                         'person_id': str(person.id),
@@ -740,58 +943,77 @@ class BlacklistService:
             return []
         
         try:
-            # Получаем результаты обычного поиска
-            all_results = await self.search_by_criteria(
+            # Фильтр по организациям применяется в запросах к БД
+            results = await self.search_by_criteria(
                 fio=fio,
                 passport=passport,
                 birthdate=birthdate,
                 department_code=department_code,
                 phone=phone,
+                organization_ids=organization_ids,
             )
             
-            # Фильтруем по организациям
-            filtered_results = [
-                result for result in all_results
-                if result.get('organization_id') in organization_ids
-            ]
-            
             logger.info(
                 f"Поиск по критериям для организаций {organization_ids}: "
-                f"найдено {len(filtered_results)} из {len(all_results)} записей"
+                f"найдено {len(results)} записей"
             )
-            return filtered_results
+            return results
             
         except Exception as e:
             logger.error(f"Ошибка при поиске по критериям для организаций: {e}", exc_info=True)
             return []
     
-    async def _get_admin_info(self, admin_uuid: UUID) -> dict:
+    async def _get_admins_info(self, admin_uuids: Iterable[UUID]) -> Dict[UUID, dict]:
         """
-        Получить информацию об администраторе.
+        Получить информацию о нескольких администраторах (с кешированием).
+        Отсутствующие в кеше админы загружаются одним запросом.
         
         Args:
-            admin_uuid: UUID администратора
+            admin_uuids: UUID администраторов
             
         Returns:
-            Словарь с информацией об админе
+            Словарь {UUID: информация об админе}; ненайденные UUID отсутствуют
         """
+        now = time.monotonic()
+        result = {}
+        missing = []
+        for admin_uuid in set(admin_uuids):
+            cached = self._admins_cache.get(admin_uuid)
+            if cached is not None and cached[0] > now:
+                result[admin_uuid] = cached[1]
+            else:
+                missing.append(admin_uuid)
+        
+        if not missing:
+            return result
+        
         try:
-            from src.bot.repo.admin_repository import AdminRepository
-            
-            # Используем существующий репозиторий через context если есть,
-            # иначе создаём временный запрос
-            query = """
-                SELECT admin_id, role FROM admins WHERE id = $1
-            """
-            row = await self._org_repo._db.fetchrow(query, admin_uuid)
-            
-            if row:
-                return {
-                    'telegram_id': row['admin_id'],
-                    'role': row['role'],
+            # Отсутствующих в кеше админов загружаем одним запросом
+            admins = await self._admin_repo.get_by_ids(missing)
+            
+            # Перед записью убираем истёкшие записи
+            cache = self._admins_cache
+            expired = [key for key, (expires_at, _) in cache.items() if expires_at <= now]
+            for admin_uuid in expired:
+                del cache[admin_uuid]
+            
+            expires = time.monotonic() + self.ADMINS_CACHE_TTL
+            for admin_uuid, admin in admins.items():
+                info = {
+                    'telegram_id': admin.admin_id,
+                    'role': admin.role.value,
                 }
-            return {'telegram_id': 'Неизвестно', 'role': 'Неизвестно'}
+                # pop + вставка переносит запись в конец порядка вставки
+                cache.pop(admin_uuid, None)
+                cache[admin_uuid] = (expires, info)
+                result[admin_uuid] = info
+            
+            # При переполнении вытесняем самые давно записанные
+            while len(cache) > self.ADMINS_CACHE_MAX_SIZE:
+                del cache[next(iter(cache))]
+            
+            return result
             
         except Exception as e:
-            logger.error(f"Ошибка при получении информации об админе: {e}")
-            return {'telegram_id': 'Неизвестно', 'role': 'Неизвестно'}
+            logger.error(f"Ошибка при получении информации об админах: {e}")
+            return result
@@ -4,14 +4,31 @@
 """
 import hashlib
 import logging
-import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 from dataclasses import dataclass
 
+from src.bot.utils.text import only_digits, only_phone_chars
+
 logger = logging.getLogger(__name__)
 
+# Правила нормализации российских номеров (цифры без ведущего '+').
+# Ключ — (длина, первая цифра); номера других длин не меняются
+_PHONE_RULES = {
+    (11, '8'): lambda d: '7' + d[1:],  # 8XXXXXXXXXX → 7XXXXXXXXXX
+    (11, '7'): lambda d: d,            # 7XXXXXXXXXX — уже нормализован
+    (12, '7'): lambda d: d[:11],       # 7XXXXXXXXXXX → первые 11 цифр
+}
+
+# Правила по одной длине — если для первой цифры нет правила выше
+_PHONE_DEFAULT_RULES = {
+    10: lambda d: '7' + d,             # XXXXXXXXXX → 7XXXXXXXXXX
+    11: lambda d: '7' + d,
+    12: lambda d: '7' + d[1:],
+}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PersonalData:
     """
     Персональные данные для хеширования.
@@ -23,7 +40,8 @@ class PersonalData:
         birthdate: Дата рождения (любой формат, будет приведена к ISO YYYY-MM-DD)
         passport: Серия и номер паспорта без пробела (10 цифр)
         department_code: Код подразделения (6 цифр)
-        phone: Номер телефона
+        phone: Номер телефона; российские номера (10–12 цифр) нормализуются
+            ровно к 12 символам +7XXXXXXXXXX, номера других длин — как есть
     """
     surname: str
     name: str
@@ -34,7 +52,7 @@ class PersonalData:
     phone: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PersonHashes:
     """
     Хеши персональных данных для хранения в БД.
@@ -47,6 +65,7 @@ class PersonHashes:
         department_code_hash: Хеш кода подразделения
         phone_hash: Хеш полного телефона
         phone_last10_hash: Хеш последних 10 цифр телефона (для частичного поиска)
+        passport_lookup_hash: Хеш паспорта без соли организации (для глобального поиска)
     """
     fio_hash: str
     surname_hash: str
@@ -55,11 +74,15 @@ class PersonHashes:
     department_code_hash: str
     phone_hash: str
     phone_last10_hash: str
+    passport_lookup_hash: str
 
 
 class HashService:
     """Сервис для хеширования персональных данных."""
     
+    # Размер LRU-кеша хешей для поиска (поле, значение, соль) → хеш
+    SEARCH_HASH_CACHE_SIZE = 4096
+    
     def __init__(self, pepper: str):
         """
         Инициализация сервиса хеширования.
@@ -68,6 +91,16 @@ class HashService:
             pepper: Глобальный секретный ключ (pepper) из конфигурации
         """
         self._pepper = pepper
+        self._pepper_bytes = pepper.encode('utf-8')
+        
+        # Кеш закодированного хвоста хеша (соль + pepper) по соли организации
+        self._suffix_cache: Dict[str, bytes] = {}
+        
+        # LRU-кеш хешей для поиска: одни и те же значения ищут повторно.
+        # Кеш принадлежит экземпляру и живёт только в памяти процесса
+        self._search_hash_cache = lru_cache(maxsize=self.SEARCH_HASH_CACHE_SIZE)(
+            self._compute_search_hash
+        )
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -80,12 +113,19 @@ class HashService:
         Returns:
             Нормализованный текст
         """
-        return " ".join(text.lower().strip().split())
+        # split() без аргументов сам отбрасывает пробелы по краям, поэтому
+        # strip() не нужен; lower() применяется к уже собранной строке
+        return " ".join(text.split()).lower()
     
     def _normalize_phone(self, phone: str) -> str:
         """
         Нормализация номера телефона к формату +79991234567.
         
+        Российский номер (10–12 цифр) всегда даёт ровно 12 символов,
+        поэтому его последние 10 цифр — это phone[2:]. Номера других длин
+        валидатор тоже пропускает (до 15 цифр), их хеши уже хранятся в БД,
+        поэтому они возвращаются без изменений, а не отклоняются.
+        
         Args:
             phone: Исходный номер телефона
             
@@ -93,33 +133,40 @@ class HashService:
             Нормализованный номер в формате +79991234567
         """
         # Удаляем все нецифровые символы кроме +
-        digits = re.sub(r'[^\d+]', '', phone)
+        digits = only_phone_chars(phone)
         
         # Если есть +, убираем его для обработки
-        has_plus = digits.startswith('+')
-        if has_plus:
+        if digits.startswith('+'):
             digits = digits[1:]
         
-        # Нормализация российских номеров
-        if len(digits) == 11:
-            # Формат 8XXXXXXXXXX или 7XXXXXXXXXX → 7XXXXXXXXXX
-            if digits[0] == '8':
-                digits = '7' + digits[1:]
-            elif digits[0] != '7':
-                digits = '7' + digits
-        elif len(digits) == 10:
-            # Формат XXXXXXXXXX → 7XXXXXXXXXX
-            digits = '7' + digits
-        elif len(digits) == 12:
-            # Формат 7XXXXXXXXXXX → берем последние 11 цифр
-            if digits.startswith('7'):
-                digits = digits[:11]
-            else:
-                digits = '7' + digits[1:]
+        # Нормализация российских номеров: правило по (длине, первой цифре),
+        # а если для первой цифры правила нет — по одной длине
+        rule = _PHONE_RULES.get((len(digits), digits[:1]))
+        if rule is None:
+            rule = _PHONE_DEFAULT_RULES.get(len(digits))
+        if rule is not None:
+            digits = rule(digits)
         
         # Возвращаем в формате +79991234567
         return '+' + digits
     
+    @staticmethod
+    def _phone_last10(phone: str) -> str:
+        """
+        Последние 10 цифр нормализованного телефона (без +7).
+        Для +79991234567 возвращает 9991234567; короткие номера — без изменений.
+        
+        Args:
+            phone: Телефон после _normalize_phone
+            
+        Returns:
+            Последние 10 цифр номера
+        """
+        # Основной случай — канонический +7XXXXXXXXXX из _normalize_phone
+        if len(phone) == 12:
+            return phone[2:]
+        return phone[-10:] if len(phone) > 12 else phone
+    
     def _normalize_date(self, date: str) -> str:
         """
         Нормализация даты рождения к формату ISO (YYYY-MM-DD).
@@ -142,6 +189,21 @@ class HashService:
         """
         date = date.strip()
         
+        # Быстрый путь для канонических форм ДД.ММ.ГГГГ и ГГГГ-ММ-ДД
+        # (почти все входные данные) — без split() и int()
+        if len(date) == 10 and date.isascii():
+            sep = date[2]
+            if (sep in './-' and date[5] == sep
+                    and (date[:2] + date[3:5] + date[6:]).isdigit()
+                    and date[:2] <= '31'):
+                return f"{date[6:]}-{date[3:5]}-{date[:2]}"
+            
+            sep = date[4]
+            if (sep in './-' and date[7] == sep
+                    and (date[:4] + date[5:7] + date[8:]).isdigit()
+                    and date[:4] > '0031'):
+                return f"{date[:4]}-{date[5:7]}-{date[8:]}"
+        
         # Разделяем по любому из разделителей
         if '.' in date:
             parts = date.split('.')
@@ -173,6 +235,26 @@ class HashService:
         
         return f"{year}-{month}-{day}"
     
+    def _salt_suffix(self, salt: str) -> bytes:
+        """
+        Получить закодированный хвост хешируемой строки (соль + pepper).
+        
+        Данные в формате хеша идут первыми, поэтому предвычислить состояние
+        SHA-256 нельзя без смены формата (и пересчёта всех хешей в БД),
+        но кодирование соли с pepper выполняется один раз на организацию.
+        
+        Args:
+            salt: Соль организации
+            
+        Returns:
+            Байты (соль + pepper) в UTF-8
+        """
+        suffix = self._suffix_cache.get(salt)
+        if suffix is None:
+            suffix = salt.encode('utf-8') + self._pepper_bytes
+            self._suffix_cache[salt] = suffix
+        return suffix
+    
     def _compute_hash(self, data: str, salt: str) -> str:
         """
         Вычислить SHA-256 хеш от данных с солью и pepper.
@@ -184,20 +266,28 @@ class HashService:
         Returns:
             Хеш в hex-формате (64 символа)
         """
-        # Формат: данные + соль организации + глобальный pepper
-        combined = f"{data}{salt}{self._pepper}"
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+        # Формат: данные + соль организации + глобальный pepper.
+        # Хвост берём из кеша напрямую — без вызова метода в горячем пути
+        suffix = self._suffix_cache.get(salt)
+        if suffix is None:
+            suffix = self._salt_suffix(salt)
+        
+        h = hashlib.sha256(data.encode('utf-8'))
+        h.update(suffix)
+        return h.hexdigest()
     
-    def generate_hashes(self, data: PersonalData, org_salt: str) -> PersonHashes:
+    def _normalize_person(self, data: PersonalData) -> tuple[bytes, bytes, bytes, bytes, bytes, bytes, bytes]:
         """
-        Генерировать все хеши для персональных данных.
+        Нормализовать все поля персональных данных перед хешированием.
+        
+        Значения сразу кодируются в UTF-8: каждое поле кодируется ровно
+        один раз, даже если участвует в нескольких хешах.
         
         Args:
             data: Персональные данные
-            org_salt: Соль организации
             
         Returns:
-            PersonHashes с хешами всех полей
+            Tuple байтов (fio, surname, birthdate, passport, department_code, phone, phone_last10)
         """
         # Нормализация данных
         surname = self._normalize_text(data.surname)
@@ -205,28 +295,126 @@ class HashService:
         patronymic = self._normalize_text(data.patronymic)
         birthdate = self._normalize_date(data.birthdate)
         # Паспорт и код подразделения - только цифры
-        passport = re.sub(r'\D', '', data.passport)
-        department_code = re.sub(r'\D', '', data.department_code)
+        passport = only_digits(data.passport)
+        department_code = only_digits(data.department_code)
         # Телефон - формат +79991234567
         phone = self._normalize_phone(data.phone)
         
         # Полное ФИО
-        fio = f"{surname} {name} {patronymic}"
+        fio = ' '.join((surname, name, patronymic))
         
         # Последние 10 цифр телефона (без +7)
-        # Для +79991234567 берем 9991234567
-        phone_last10 = phone[-10:] if len(phone) >= 12 else phone
-        
-        return PersonHashes(
-            fio_hash=self._compute_hash(fio, org_salt),
-            surname_hash=self._compute_hash(surname, org_salt),
-            birthdate_hash=self._compute_hash(birthdate, org_salt),
-            passport_hash=self._compute_hash(passport, org_salt),
-            department_code_hash=self._compute_hash(department_code, org_salt),
-            phone_hash=self._compute_hash(phone, org_salt),
-            phone_last10_hash=self._compute_hash(phone_last10, org_salt),
+        phone_last10 = self._phone_last10(phone)
+        
+        return (
+            fio.encode('utf-8'),
+            surname.encode('utf-8'),
+            birthdate.encode('utf-8'),
+            passport.encode('utf-8'),
+            department_code.encode('utf-8'),
+            phone.encode('utf-8'),
+            phone_last10.encode('utf-8'),
         )
     
+    def generate_hashes(self, data: PersonalData, org_salt: str) -> PersonHashes:
+        """
+        Генерировать все хеши для персональных данных.
+        
+        Args:
+            data: Персональные данные
+            org_salt: Соль организации
+            
+        Returns:
+            PersonHashes с хешами всех полей
+        """
+        return self.generate_hashes_batch([data], org_salt)[0]
+    
+    def generate_hashes_batch(
+        self,
+        data: Sequence[PersonalData],
+        org_salt: str,
+    ) -> List[PersonHashes]:
+        """
+        Генерировать хеши для списка персональных данных одной организации.
+        
+        Хвост (соль + pepper) кодируется один раз на весь пакет, а во
+        внутреннем цикле нет обращений к атрибутам — это заметно при
+        массовом добавлении записей.
+        
+        Пакет намеренно обрабатывается в одном потоке: hashlib отпускает GIL
+        только для данных от 2 КБ, а поля персональных данных — десятки байт,
+        поэтому пул потоков добавил бы лишь накладные расходы на переключение.
+        
+        Args:
+            data: Список персональных данных
+            org_salt: Соль организации
+            
+        Returns:
+            Список PersonHashes в том же порядке
+        """
+        sha256 = hashlib.sha256
+        suffix = self._salt_suffix(org_salt)
+        # Глобальный хеш паспорта — без соли организации (только pepper)
+        lookup_suffix = self._salt_suffix("")
+        normalize = self._normalize_person
+        
+        result = []
+        for item in data:
+            values = normalize(item)
+            # Короткие байты дешевле склеить, чем вызывать update() отдельно
+            fio, surname, birthdate, passport, department_code, phone, phone_last10 = [
+                sha256(value + suffix).hexdigest() for value in values
+            ]
+            
+            # Глобальный хеш паспорта: только pepper, без соли организации
+            lookup = sha256(values[3] + lookup_suffix)
+            result.append(PersonHashes(
+                fio_hash=fio,
+                surname_hash=surname,
+                birthdate_hash=birthdate,
+                passport_hash=passport,
+                department_code_hash=department_code,
+                phone_hash=phone,
+                phone_last10_hash=phone_last10,
+                passport_lookup_hash=lookup.hexdigest(),
+            ))
+        return result
+    
+    def _normalize_field(self, field: str, value: str) -> str:
+        """
+        Нормализовать значение поля перед хешированием.
+        
+        Args:
+            field: Название поля (fio, surname, birthdate, passport,
+                   department_code, phone, phone_last10)
+            value: Исходное значение
+            
+        Returns:
+            Нормализованное значение
+        """
+        # Нормализуем значение в зависимости от поля
+        if field in ['fio', 'surname']:
+            return self._normalize_text(value)
+        elif field == 'birthdate':
+            return self._normalize_date(value)
+        elif field in ('passport', 'department_code'):
+            # Паспорт и код подразделения - только цифры;
+            # уже очищенное значение возвращаем как есть
+            if value.isascii() and value.isdigit():
+                return value
+            return only_digits(value)
+        elif field == 'phone':
+            # Телефон - формат +79991234567
+            return self._normalize_phone(value)
+        elif field == 'phone_last10':
+            # Последние 10 цифр телефона (без +7).
+            # Ровно 10 цифр — это и есть результат, нормализация не нужна
+            if len(value) == 10 and value.isascii() and value.isdigit():
+                return value
+            return self._phone_last10(self._normalize_phone(value))
+        else:
+            return value
+    
     def compute_search_hash(
         self, 
         field: str, 
@@ -245,29 +433,60 @@ class HashService:
         Returns:
             Хеш для поиска
         """
-        # Нормализуем значение в зависимости от поля
-        if field in ['fio', 'surname']:
-            normalized = self._normalize_text(value)
-        elif field == 'birthdate':
-            normalized = self._normalize_date(value)
-        elif field == 'passport':
-            # Паспорт - только цифры
-            normalized = re.sub(r'\D', '', value)
-        elif field == 'department_code':
-            # Код подразделения - только цифры
-            normalized = re.sub(r'\D', '', value)
-        elif field == 'phone':
-            # Телефон - формат +79991234567
-            normalized = self._normalize_phone(value)
-        elif field == 'phone_last10':
-            # Последние 10 цифр телефона (без +7)
-            normalized_phone = self._normalize_phone(value)
-            normalized = normalized_phone[-10:] if len(normalized_phone) >= 12 else normalized_phone
-        else:
-            normalized = value
-        
+        return self._search_hash_cache(field, value, org_salt)
+    
+    def _compute_search_hash(self, field: str, value: str, org_salt: str) -> str:
+        """Вычислить хеш для поиска без кеширования (см. compute_search_hash)."""
+        normalized = self._normalize_field(field, value)
         return self._compute_hash(normalized, org_salt)
     
+    def compute_passport_lookup_hash(self, passport: str) -> str:
+        """
+        Вычислить хеш паспорта без соли организации (только с pepper).
+        Одинаков для всех организаций, поэтому позволяет искать паспорт
+        одним запросом по индексу.
+        
+        Args:
+            passport: Серия и номер паспорта
+            
+        Returns:
+            Хеш для глобального поиска
+        """
+        return self._compute_hash(self._normalize_field("passport", passport), "")
+    
+    def compute_search_hashes_batch(
+        self,
+        field: str,
+        value: str,
+        salts: Sequence[str],
+    ) -> List[str]:
+        """
+        Вычислить хеши для поиска по одному полю сразу для нескольких солей.
+        
+        Значение нормализуется один раз, а состояние SHA-256 после данных
+        переиспользуется для каждой соли — результат совпадает с
+        compute_search_hash для каждой соли по отдельности.
+        
+        Args:
+            field: Название поля (см. compute_search_hash)
+            value: Значение для поиска
+            salts: Соли организаций
+            
+        Returns:
+            Список хешей в порядке переданных солей
+        """
+        normalized = self._normalize_field(field, value)
+        prefix = hashlib.sha256(normalized.encode('utf-8'))
+        
+        salt_suffix = self._salt_suffix
+        
+        hashes = []
+        for salt in salts:
+            h = prefix.copy()
+            h.update(salt_suffix(salt))
+            hashes.append(h.hexdigest())
+        return hashes
+    
     def compute_fio_hash(
         self, 
         surname: str, 
@@ -287,5 +506,12 @@ class HashService:
         Returns:
             Хеш ФИО
         """
-        fio = f"{self._normalize_text(surname)} {self._normalize_text(name)} {self._normalize_text(patronymic)}"
-        return self._compute_hash(fio, org_salt)
+        # Части ФИО подаются в SHA-256 по очереди — без сборки строки ФИО;
+        # результат совпадает с хешем "фамилия имя отчество"
+        h = hashlib.sha256(self._normalize_text(surname).encode('utf-8'))
+        h.update(b' ')
+        h.update(self._normalize_text(name).encode('utf-8'))
+        h.update(b' ')
+        h.update(self._normalize_text(patronymic).encode('utf-8'))
+        h.update(self._salt_suffix(org_salt))
+        return h.hexdigest()
@@ -7,6 +7,8 @@ import logging
 from typing import Optional
 from dataclasses import dataclass
 
+from src.bot.utils.text import FIO_CHARS, only_digits, only_phone_chars
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +66,16 @@ class SearchDataParser:
         r'^[a-zA-Zа-яА-ЯёЁ\-]+\s+[a-zA-Zа-яА-ЯёЁ\-]+\s+[a-zA-Zа-яА-ЯёЁ\-]+$'
     )
     
+    # Возможные поля по количеству цифр в строке: ФИО — без цифр,
+    # код подразделения — 6, дата — 8, паспорт — 10, телефон — 11
+    _CANDIDATES_BY_DIGITS = {
+        0: ('fio',),
+        6: ('department_code',),
+        8: ('birthdate',),
+        10: ('passport',),
+        11: ('phone',),
+    }
+    
     @classmethod
     def parse(cls, text: str) -> ParsedSearchData:
         """
@@ -77,43 +89,73 @@ class SearchDataParser:
         """
         result = ParsedSearchData()
         
-        # Разбиваем по строкам
-        lines = [line.strip() for line in text.strip().split('\n') if line.strip()]
-        
-        for line in lines:
-            # Пробуем распознать каждую строку
-            if not result.passport and cls._is_passport(line):
+        # Один проход по строкам: splitlines() выполняется в C и понимает CRLF
+        for line in text.splitlines():
+            # Все поля уже распознаны — остальные строки ничего не изменят
+            if (result.fio and result.passport and result.birthdate
+                    and result.department_code and result.phone):
+                break
+            
+            line = line.strip()
+            if not line:
+                continue
+            
+            # Проверяем только те поля, которые возможны при таком
+            # количестве цифр в строке, в прежнем порядке приоритета
+            candidates = cls._classify(line)
+            
+            if 'fio' in candidates:
+                if not result.fio and cls._is_fio(line):
+                    result.fio = cls._normalize_fio(line)
+                    logger.debug(f"Распознано ФИО: {result.fio}")
+                continue
+            
+            if 'passport' in candidates and not result.passport and cls._is_passport(line):
                 result.passport = cls._normalize_passport(line)
                 logger.debug(f"Распознан паспорт: {result.passport}")
                 continue
             
-            if not result.department_code and cls._is_department_code(line):
+            if ('department_code' in candidates and not result.department_code
+                    and cls._is_department_code(line)):
                 result.department_code = cls._normalize_department_code(line)
                 logger.debug(f"Распознан код подразделения: {result.department_code}")
                 continue
             
-            if not result.birthdate and cls._is_date(line):
+            if 'birthdate' in candidates and not result.birthdate and cls._is_date(line):
                 result.birthdate = cls._normalize_date(line)
                 logger.debug(f"Распознана дата рождения: {result.birthdate}")
                 continue
             
-            if not result.phone and cls._is_phone(line):
+            if 'phone' in candidates and not result.phone and cls._is_phone(line):
                 result.phone = cls._normalize_phone(line)
                 logger.debug(f"Распознан телефон: {result.phone}")
                 continue
-            
-            if not result.fio and cls._is_fio(line):
-                result.fio = cls._normalize_fio(line)
-                logger.debug(f"Распознано ФИО: {result.fio}")
-                continue
         
         return result
     
+    @classmethod
+    def _classify(cls, line: str) -> tuple[str, ...]:
+        """
+        Определить, какими полями может быть строка, без регулярных выражений.
+        
+        Args:
+            line: Строка без пробелов по краям
+            
+        Returns:
+            Кортеж возможных полей в порядке проверки (пустой — строка не распознаётся)
+        """
+        digits_count = len(only_digits(line))
+        candidates = cls._CANDIDATES_BY_DIGITS.get(digits_count, ())
+        # '+' в строке с цифрами может дать телефон при любом количестве цифр
+        if digits_count and '+' in line and 'phone' not in candidates:
+            candidates += ('phone',)
+        return candidates
+    
     @classmethod
     def _is_passport(cls, text: str) -> bool:
         """Проверяет, является ли текст паспортными данными."""
         # Удаляем все нецифровые символы для проверки
-        digits = re.sub(r'\D', '', text)
+        digits = only_digits(text)
         if len(digits) == 10:
             # Дополнительная проверка: серия не начинается с 0
             if not digits.startswith('0'):
@@ -123,12 +165,12 @@ class SearchDataParser:
     @classmethod
     def _normalize_passport(cls, text: str) -> str:
         """Нормализует паспорт к 10 цифрам."""
-        return re.sub(r'\D', '', text)
+        return only_digits(text)
     
     @classmethod
     def _is_department_code(cls, text: str) -> bool:
         """Проверяет, является ли текст кодом подразделения."""
-        digits = re.sub(r'\D', '', text)
+        digits = only_digits(text)
         # 6 цифр и не похоже на другие данные
         if len(digits) == 6:
             # Исключаем случай, когда это часть паспорта
@@ -138,7 +180,7 @@ class SearchDataParser:
     @classmethod
     def _normalize_department_code(cls, text: str) -> str:
         """Нормализует код подразделения к 6 цифрам."""
-        return re.sub(r'\D', '', text)
+        return only_digits(text)
     
     @classmethod
     def _is_date(cls, text: str) -> bool:
@@ -158,7 +200,7 @@ class SearchDataParser:
     def _is_phone(cls, text: str) -> bool:
         """Проверяет, является ли текст номером телефона."""
         # Удаляем все нецифровые кроме +
-        clean = re.sub(r'[^\d+]', '', text)
+        clean = only_phone_chars(text)
         
         # Начинается с +7, 8, 7 и содержит 11 цифр
         if clean.startswith('+7') and len(clean) == 12:
@@ -181,7 +223,7 @@ class SearchDataParser:
         Нормализует телефон к формату +7XXXXXXXXXX.
         """
         # Удаляем все нецифровые символы
-        digits = re.sub(r'\D', '', text)
+        digits = only_digits(text)
         
         # Если начинается с 8, меняем на 7
         if len(digits) == 11 and digits.startswith('8'):
@@ -196,19 +238,13 @@ class SearchDataParser:
     @classmethod
     def _is_fio(cls, text: str) -> bool:
         """Проверяет, является ли текст ФИО (3 слова)."""
-        # Удаляем лишние пробелы
-        cleaned = ' '.join(text.split())
-        parts = cleaned.split()
+        parts = text.split()
         
         if len(parts) != 3:
             return False
         
-        # Каждая часть должна содержать только буквы и дефис
-        for part in parts:
-            if not re.match(r'^[a-zA-Zа-яА-ЯёЁ\-]{2,}$', part):
-                return False
-        
-        return True
+        # Каждая часть — минимум 2 символа, только буквы и дефис
+        return all(len(part) >= 2 and FIO_CHARS.issuperset(part) for part in parts)
     
     @classmethod
     def _normalize_fio(cls, text: str) -> str:
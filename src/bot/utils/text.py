@@ -0,0 +1,42 @@
+"""
+Общие функции и наборы символов для разбора текста: парсер, валидаторы, хеш-сервис.
+"""
+import re
+import string
+
+
+# Допустимые символы слова ФИО: буквы (кириллица/латиница, включая ё/Ё) и дефис.
+# Проверка через frozenset выполняется в C и не запускает движок regex;
+# str.isalpha() не подходит — он пропускает буквы любых алфавитов
+FIO_CHARS = frozenset(
+    string.ascii_letters
+    + ''.join(chr(c) for c in range(ord('а'), ord('я') + 1))
+    + ''.join(chr(c) for c in range(ord('А'), ord('Я') + 1))
+    + 'ёЁ-'
+)
+
+# Удаление нецифровых символов (и нецифровых, кроме '+').
+# Для ASCII-строк (почти все входные данные) используется str.translate —
+# один проход без движка регулярных выражений; иначе — предкомпилированный regex
+_NON_DIGIT_RE = re.compile(r'\D')
+_NON_PHONE_RE = re.compile(r'[^\d+]')
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+_NON_PHONE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit() and chr(c) != '+'
+))
+
+
+def only_digits(text: str) -> str:
+    """Оставить в строке только цифры."""
+    if text.isascii():
+        return text.translate(_NON_DIGIT_TABLE)
+    return _NON_DIGIT_RE.sub('', text)
+
+
+def only_phone_chars(text: str) -> str:
+    """Оставить в строке только цифры и '+'."""
+    if text.isascii():
+        return text.translate(_NON_PHONE_TABLE)
+    return _NON_PHONE_RE.sub('', text)
@@ -2,17 +2,38 @@
 Утилиты валидации персональных данных.
 Проверка корректности ФИО, даты, паспортных данных, телефона, кода подразделения.
 """
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
-from datetime import datetime
+from datetime import date
 
+from src.bot.utils.text import FIO_CHARS, only_digits
 
-@dataclass
+
+# Правила нормализации российских номеров (только цифры).
+# Ключ — (длина, первая цифра); номера других длин не меняются
+_PHONE_RULES = {
+    (11, '8'): lambda d: '7' + d[1:],  # 8XXXXXXXXXX → 7XXXXXXXXXX
+    (11, '7'): lambda d: d,            # 7XXXXXXXXXX — уже нормализован
+    (12, '7'): lambda d: d,            # +7XXXXXXXXXX без '+' — как есть
+}
+
+# Правила по одной длине — если для первой цифры нет правила выше
+_PHONE_DEFAULT_RULES = {
+    10: lambda d: '7' + d,             # XXXXXXXXXX → 7XXXXXXXXXX
+    11: lambda d: '7' + d,             # не начинается с 7 или 8 — добавляем 7
+    12: lambda d: '7' + d[1:],
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """
     Результат валидации.
     
+    Неизменяемый: результаты структурных валидаторов кешируются
+    и один и тот же экземпляр может вернуться несколько раз.
+    
     Attributes:
         is_valid: Прошла ли валидация
         error: Сообщение об ошибке (если не прошла)
@@ -26,6 +47,11 @@ class ValidationResult:
 class Validators:
     """Класс с методами валидации персональных данных."""
     
+    # Размер LRU-кеша структурных валидаторов (паспорт, код подразделения,
+    # телефон): одно и то же значение повторно проверяется на шагах диалога.
+    # ФИО, дата (зависит от текущей даты) и причина не кешируются
+    VALIDATION_CACHE_SIZE = 2048
+    
     # =========================================================================
     # ФИО
     # =========================================================================
@@ -50,8 +76,8 @@ class Validators:
         if not fio or not fio.strip():
             return ValidationResult(False, "ФИО не может быть пустым")
         
-        # Убираем лишние пробелы
-        fio = " ".join(fio.strip().split())
+        # split() без аргументов сам убирает пробелы по краям и схлопывает
+        # повторяющиеся; итоговая строка собирается из normalized_parts
         parts = fio.split()
         
         if len(parts) < 3:
@@ -60,9 +86,6 @@ class Validators:
                 "ФИО должно содержать минимум 3 слова (Фамилия Имя Отчество)"
             )
         
-        # Паттерн для слова: буквы (кириллица/латиница) и дефис
-        word_pattern = re.compile(r'^[а-яёА-ЯЁa-zA-Z-]+$')
-        
         normalized_parts = []
         for i, part in enumerate(parts):
             if len(part) < 2:
@@ -72,7 +95,7 @@ class Validators:
                     f"{position} должно содержать минимум 2 символа"
                 )
             
-            if not word_pattern.match(part):
+            if not FIO_CHARS.issuperset(part):
                 return ValidationResult(
                     False, 
                     f"'{part}' содержит недопустимые символы. Разрешены только буквы и дефис"
@@ -114,44 +137,38 @@ class Validators:
         
         date_str = date_str.strip()
         
-        # Определяем формат и парсим дату
-        formats = [
-            (r'^(\d{2})\.(\d{2})\.(\d{4})$', 'dmy'),  # DD.MM.YYYY
-            (r'^(\d{2})/(\d{2})/(\d{4})$', 'dmy'),    # DD/MM/YYYY
-            (r'^(\d{2})-(\d{2})-(\d{4})$', 'dmy'),    # DD-MM-YYYY
-            (r'^(\d{4})-(\d{2})-(\d{2})$', 'ymd'),    # YYYY-MM-DD
-            (r'^(\d{4})/(\d{2})/(\d{2})$', 'ymd'),    # YYYY/MM/DD
-        ]
-        
-        day, month, year = None, None, None
-        
-        for pattern, order in formats:
-            match = re.match(pattern, date_str)
-            if match:
-                groups = match.groups()
-                if order == 'dmy':
-                    day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                else:  # ymd
-                    year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                break
-        
-        if day is None:
+        # Определяем формат по позиции разделителя и парсим дату без regex
+        parts = None
+        if len(date_str) == 10:
+            sep = date_str[4]
+            if sep in '-/' and date_str[7] == sep:
+                # YYYY-MM-DD или YYYY/MM/DD
+                year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+                parts = (year, month, day)
+            else:
+                sep = date_str[2]
+                if sep in './-' and date_str[5] == sep:
+                    # DD.MM.YYYY, DD/MM/YYYY или DD-MM-YYYY
+                    day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+                    parts = (year, month, day)
+        
+        if parts is None or not all(part.isdecimal() for part in parts):
             return ValidationResult(
                 False, 
                 "Неверный формат даты. Используйте ДД.ММ.ГГГГ"
             )
         
+        year, month, day = int(year), int(month), int(day)
+        
         # Проверяем валидность даты
         try:
-            birth_date = datetime(year, month, day)
+            birth_date = date(year, month, day)
         except ValueError:
             return ValidationResult(False, "Указана несуществующая дата")
         
         # Проверяем возраст
-        today = datetime.now()
-        age = today.year - birth_date.year - (
-            (today.month, today.day) < (birth_date.month, birth_date.day)
-        )
+        today = date.today()
+        age = today.year - year - ((today.month, today.day) < (month, day))
         
         if age < 14:
             return ValidationResult(False, "Возраст должен быть не менее 14 лет")
@@ -162,8 +179,12 @@ class Validators:
         if birth_date > today:
             return ValidationResult(False, "Дата рождения не может быть в будущем")
         
-        # Нормализуем в ISO формат
-        normalized = f"{year:04d}-{month:02d}-{day:02d}"
+        # Нормализуем в ISO формат: части уже нужной ширины (4/2/2),
+        # поэтому ASCII-дату достаточно собрать из исходных срезов
+        if date_str.isascii():
+            normalized = '-'.join(parts)
+        else:
+            normalized = f"{year:04d}-{month:02d}-{day:02d}"
         return ValidationResult(True, normalized=normalized)
     
     # =========================================================================
@@ -171,6 +192,7 @@ class Validators:
     # =========================================================================
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_passport(passport: str) -> ValidationResult:
         """
         Валидация паспортных данных РФ (серия и номер).
@@ -189,7 +211,7 @@ class Validators:
             return ValidationResult(False, "Паспортные данные не могут быть пустыми")
         
         # Оставляем только цифры
-        digits = re.sub(r'\D', '', passport)
+        digits = only_digits(passport)
         
         if len(digits) != 10:
             return ValidationResult(
@@ -205,6 +227,7 @@ class Validators:
     # =========================================================================
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_department_code(code: str) -> ValidationResult:
         """
         Валидация кода подразделения.
@@ -223,7 +246,7 @@ class Validators:
             return ValidationResult(False, "Код подразделения не может быть пустым")
         
         # Оставляем только цифры
-        digits = re.sub(r'\D', '', code)
+        digits = only_digits(code)
         
         if len(digits) != 6:
             return ValidationResult(
@@ -238,6 +261,7 @@ class Validators:
     # =========================================================================
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_phone(phone: str) -> ValidationResult:
         """
         Валидация номера телефона.
@@ -257,7 +281,7 @@ class Validators:
             return ValidationResult(False, "Номер телефона не может быть пустым")
         
         # Оставляем только цифры
-        digits = re.sub(r'\D', '', phone)
+        digits = only_digits(phone)
         
         if len(digits) < 10:
             return ValidationResult(
@@ -271,26 +295,16 @@ class Validators:
                 f"Номер телефона слишком длинный. Максимум 15 цифр"
             )
         
-        # Нормализация российских номеров к формату +79991234567
-        if len(digits) == 11:
-            # Формат 8XXXXXXXXXX или 7XXXXXXXXXX → 7XXXXXXXXXX
-            if digits[0] == '8':
-                digits = '7' + digits[1:]
-            elif digits[0] != '7':
-                # Если не начинается с 7 или 8, добавляем 7
-                digits = '7' + digits
-        elif len(digits) == 10:
-            # Формат XXXXXXXXXX → 7XXXXXXXXXX
-            digits = '7' + digits
-        elif len(digits) == 12:
-            # Формат +7XXXXXXXXXX (если + был удален ранее) → 7XXXXXXXXXX
-            if digits.startswith('7'):
-                digits = digits
-            else:
-                digits = '7' + digits[1:]
+        # Нормализация российских номеров к формату +79991234567:
+        # правило по (длине, первой цифре), иначе — по одной длине
+        rule = _PHONE_RULES.get((len(digits), digits[0]))
+        if rule is None:
+            rule = _PHONE_DEFAULT_RULES.get(len(digits))
+        if rule is not None:
+            digits = rule(digits)
         
         # Приводим к формату +79991234567
-        normalized = '+' + digits if not digits.startswith('+') else digits
+        normalized = '+' + digits
         
         return ValidationResult(True, normalized=normalized)
     
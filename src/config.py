@@ -7,6 +7,7 @@ import sys
 import logging
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 from dotenv import load_dotenv
 
 # Загружаем переменные окружения из .env
@@ -15,20 +16,25 @@ load_dotenv()
 
 @dataclass
 class DatabaseConfig:
-    """Конфигурация базы данных."""
+    """
+    Конфигурация базы данных.
+    
+    Без slots: connection_string кешируется через cached_property,
+    которому нужен __dict__ экземпляра.
+    """
     host: str
     port: int
     user: str
     password: str
     database: str
     
-    @property
+    @cached_property
     def connection_string(self) -> str:
-        """Возвращает строку подключения к БД."""
+        """Возвращает строку подключения к БД (вычисляется один раз)."""
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """Конфигурация Telegram бота."""
     token: str
@@ -42,16 +48,17 @@ class BotConfig:
             raise ValueError("BOT_TOKEN не установлен в переменных окружения")
         
         admin_ids_str = os.getenv("ADMIN_IDS", "")
+        # Каждая часть очищается от пробелов один раз; пустые пропускаются
         admin_ids = [
-            int(admin_id.strip()) 
-            for admin_id in admin_ids_str.split(",") 
-            if admin_id.strip()
+            int(admin_id)
+            for admin_id in (part.strip() for part in admin_ids_str.split(","))
+            if admin_id
         ]
         
         return cls(token=token, admin_ids=admin_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     """Конфигурация безопасности для хеширования персональных данных."""
     hash_pepper: str
@@ -72,7 +79,7 @@ class SecurityConfig:
         return cls(hash_pepper=hash_pepper)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Основная конфигурация приложения."""
     bot: BotConfig
@@ -133,8 +140,6 @@ def get_config() -> Config:
     """Получить конфигурацию приложения (singleton)."""
     global config
     if config is None:
-        # Настраиваем логирование при первой загрузке конфигурации
-        setup_logging()
         config = Config.from_env()
     return config
 
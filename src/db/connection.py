@@ -3,7 +3,7 @@
 Обеспечивает инициализацию и управление соединением с БД.
 """
 import logging
-from typing import Optional
+from typing import Optional, Iterable
 from contextlib import asynccontextmanager
 
 import asyncpg
@@ -38,6 +38,14 @@ class DatabaseManager:
                 database=self.config.database,
                 min_size=2,
                 max_size=10,
+                # Бот выполняет небольшой набор одних и тех же параметризованных
+                # запросов: подготовленные выражения кешируются на соединении
+                # без истечения срока, чтобы не разбирать и не планировать их заново
+                statement_cache_size=1024,
+                max_cached_statement_lifetime=0,
+                max_inactive_connection_lifetime=300,
+                # Короткие OLTP-запросы: JIT PostgreSQL только добавляет задержку
+                server_settings={'jit': 'off'},
             )
             logger.info("Пул подключений к БД создан")
             
@@ -68,6 +76,10 @@ class DatabaseManager:
         """
         Выполнить SQL запрос.
         
+        Запросы execute/fetch/fetchrow выполняются через методы пула —
+        он сам берёт и возвращает соединение. Для транзакций используйте
+        get_connection().
+        
         Args:
             query: SQL запрос
             *args: Параметры запроса
@@ -78,8 +90,7 @@ class DatabaseManager:
         if not self.pool:
             raise RuntimeError("Пул подключений не инициализирован")
         
-        async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        return await self.pool.execute(query, *args)
     
     async def fetch(self, query: str, *args) -> list:
         """
@@ -95,8 +106,7 @@ class DatabaseManager:
         if not self.pool:
             raise RuntimeError("Пул подключений не инициализирован")
         
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self.pool.fetch(query, *args)
     
     async def fetchrow(self, query: str, *args) -> Optional[dict]:
         """
@@ -112,8 +122,25 @@ class DatabaseManager:
         if not self.pool:
             raise RuntimeError("Пул подключений не инициализирован")
         
+        return await self.pool.fetchrow(query, *args)
+    
+    async def execute_many_ddl(self, statements: Iterable[str]) -> None:
+        """
+        Выполнить несколько DDL-выражений по очереди на одном соединении.
+        
+        Соединение берётся из пула один раз на весь набор, а не на каждое
+        выражение. Выражения выполняются вне транзакции (подходит для
+        CREATE INDEX CONCURRENTLY).
+        
+        Args:
+            statements: SQL-выражения
+        """
+        if not self.pool:
+            raise RuntimeError("Пул подключений не инициализирован")
+        
         async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+            for statement in statements:
+                await conn.execute(statement)
     
     async def close(self) -> None:
         """Закрыть пул подключений."""
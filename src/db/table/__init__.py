@@ -2,10 +2,23 @@
 Модуль таблиц базы данных.
 Содержит SQL схемы и функции инициализации таблиц.
 """
+import asyncio
+import hashlib
 import logging
+import re
+
+import asyncpg
 
 from src.db.connection import DatabaseManager
-from src.db.table.base import UPDATE_TIMESTAMP_FUNCTION_SQL
+from src.db.table.base import (
+    DROP_LEGACY_UPDATE_TRIGGERS_SQL,
+    SCHEMA_META_TABLE_SQL,
+    SCHEMA_VERSION_EXISTS_SQL,
+    SCHEMA_VERSION_INSERT_SQL,
+    SCHEMA_INDEXES_SQL,
+    SCHEMA_TRY_LOCK_SQL,
+    SCHEMA_UNLOCK_SQL,
+)
 from src.db.table import admins
 from src.db.table import organizations
 from src.db.table import admin_organizations
@@ -16,7 +29,81 @@ from src.db.table import blacklist_history
 logger = logging.getLogger(__name__)
 
 
-async def initialize_tables(db_manager: DatabaseManager) -> None:
+# Полный DDL-скрипт без индексов: все таблицы в порядке зависимостей
+# и удаление прежних триггеров. Выполняется одним запросом (одна передача
+# по сети вместо отдельного запроса на каждое выражение) в одной транзакции.
+# Таблицы с миграциями дают FULL_SQL (таблица + миграции), остальные — TABLE_SQL
+SCHEMA_SQL = (
+    admins.TABLE_SQL
+    + organizations.TABLE_SQL
+    + admin_organizations.FULL_SQL
+    + blacklist_persons.FULL_SQL
+    + blacklist_records.TABLE_SQL
+    + blacklist_history.FULL_SQL
+    + DROP_LEGACY_UPDATE_TRIGGERS_SQL
+    + SCHEMA_META_TABLE_SQL
+)
+
+# Индексы по таблицам. Создаются CONCURRENTLY — без блокировки записи
+# в заполненную таблицу; такой CREATE INDEX нельзя выполнять в транзакции,
+# поэтому каждый индекс — отдельным запросом после SCHEMA_SQL
+SCHEMA_INDEX_SQLS = (
+    admins.INDEX_SQLS,
+    organizations.INDEX_SQLS,
+    admin_organizations.INDEX_SQLS,
+    blacklist_persons.INDEX_SQLS,
+    blacklist_records.INDEX_SQLS,
+    blacklist_history.INDEX_SQLS,
+)
+
+# Ключ advisory-блокировки инициализации схемы (общий для всех экземпляров бота)
+SCHEMA_LOCK_KEY = 918273645
+
+# Интервал опроса блокировки инициализации схемы, секунды
+SCHEMA_LOCK_POLL_INTERVAL = 0.5
+
+# Сколько таблиц индексируется одновременно (каждая — на своём соединении)
+INDEX_BUILD_CONCURRENCY = 4
+
+# Память под сортировку при построении индекса — на каждое соединение
+INDEX_BUILD_MAINTENANCE_WORK_MEM = "256MB"
+
+# Имя индекса в CREATE INDEX ... IF NOT EXISTS / DROP INDEX ... IF EXISTS
+_INDEX_NAME_RE = re.compile(r'IF\s+(?:NOT\s+)?EXISTS\s+(\w+)', re.IGNORECASE)
+
+# Таблицы схемы — для чтения их индексов из каталога
+SCHEMA_TABLES = [
+    "admins",
+    "organizations",
+    "admin_organizations",
+    "blacklist_persons",
+    "blacklist_records",
+    "blacklist_history",
+]
+
+
+def _schema_version() -> str:
+    """
+    Вычислить версию схемы — хеш DDL-скрипта и индексов.
+    
+    Хеш считается потоково, без склейки всего DDL в одну строку,
+    которая иначе жила бы в памяти процесса до его завершения.
+    
+    Returns:
+        SHA-256 (hex) полного текста схемы
+    """
+    digest = hashlib.sha256(SCHEMA_SQL.encode('utf-8'))
+    for index_sqls in SCHEMA_INDEX_SQLS:
+        for index_sql in index_sqls:
+            digest.update(index_sql.encode('utf-8'))
+    return digest.hexdigest()
+
+
+# Версия схемы: любое изменение SQL даёт новую версию
+SCHEMA_VERSION = _schema_version()
+
+
+async def initialize_tables(db_manager: DatabaseManager, with_indexes: bool = True) -> None:
     """
     Инициализировать все таблицы базы данных.
     
@@ -30,32 +117,199 @@ async def initialize_tables(db_manager: DatabaseManager) -> None:
     
     Args:
         db_manager: Менеджер подключения к базе данных
+        with_indexes: Построить индексы сразу. False — для первичной загрузки
+            данных (COPY без поддержки индексов на каждую строку): индексы
+            и отметку версии схемы затем создаёт create_indexes
     """
     try:
         logger.info("Инициализация таблиц базы данных...")
         
-        # Создаем функцию для обновления timestamp (нужна для всех таблиц)
-        await db_manager.execute(UPDATE_TIMESTAMP_FUNCTION_SQL)
-        logger.debug("Функция update_updated_column создана")
+        async with db_manager.get_connection() as conn:
+            # Схема этой версии уже применена — DDL не выполняем
+            if await _is_schema_applied(conn):
+                logger.info(f"Схема БД актуальна (версия {SCHEMA_VERSION[:12]}), инициализация пропущена")
+                return
+            
+            # При одновременном запуске нескольких экземпляров бота DDL
+            # выполняет только один: остальные ждут блокировку и перепроверяют версию.
+            # Ждём опросом pg_try_advisory_lock, а не pg_advisory_lock: ожидающий
+            # запрос держал бы снимок, и CREATE INDEX CONCURRENTLY у владельца
+            # блокировки ждал бы его завершения — взаимная блокировка
+            while not await conn.fetchval(SCHEMA_TRY_LOCK_SQL, SCHEMA_LOCK_KEY):
+                await asyncio.sleep(SCHEMA_LOCK_POLL_INTERVAL)
+            try:
+                if await _is_schema_applied(conn):
+                    logger.info(f"Схема БД применена другим экземпляром (версия {SCHEMA_VERSION[:12]})")
+                    return
+                
+                await _apply_schema(db_manager, conn, with_indexes)
+            finally:
+                await conn.execute(SCHEMA_UNLOCK_SQL, SCHEMA_LOCK_KEY)
         
-        # Базовые таблицы
-        await admins.create_table(db_manager)
-        await organizations.create_table(db_manager)
+        logger.info("Все таблицы успешно инициализированы")
         
-        # Таблицы с зависимостями от базовых
-        await admin_organizations.create_table(db_manager)
+    except Exception as e:
+        logger.error(f"Ошибка при инициализации таблиц: {e}", exc_info=True)
+        raise
+
+
+async def create_indexes(db_manager: DatabaseManager) -> None:
+    """
+    Построить индексы всех таблиц и отметить версию схемы применённой.
+    
+    Вызывается после первичной загрузки данных, если таблицы были созданы
+    через initialize_tables(db_manager, with_indexes=False).
+    
+    Args:
+        db_manager: Менеджер подключения к базе данных
+    """
+    try:
+        logger.info("Построение индексов базы данных...")
         
-        # Таблицы черного списка
-        await blacklist_persons.create_table(db_manager)
-        await blacklist_records.create_table(db_manager)
-        await blacklist_history.create_table(db_manager)
+        async with db_manager.get_connection() as conn:
+            while not await conn.fetchval(SCHEMA_TRY_LOCK_SQL, SCHEMA_LOCK_KEY):
+                await asyncio.sleep(SCHEMA_LOCK_POLL_INTERVAL)
+            try:
+                await _build_indexes(db_manager, conn)
+            finally:
+                await conn.execute(SCHEMA_UNLOCK_SQL, SCHEMA_LOCK_KEY)
         
-        logger.info("Все таблицы успешно инициализированы")
+        logger.info("Индексы успешно построены")
         
     except Exception as e:
-        logger.error(f"Ошибка при инициализации таблиц: {e}", exc_info=True)
+        logger.error(f"Ошибка при построении индексов: {e}", exc_info=True)
         raise
 
 
-__all__ = ["initialize_tables"]
+async def _apply_schema(
+    db_manager: DatabaseManager,
+    conn: asyncpg.Connection,
+    with_indexes: bool = True,
+) -> None:
+    """
+    Применить схему: таблицы в транзакции, затем индексы и отметка версии.
+    
+    Args:
+        db_manager: Менеджер подключения к базе данных
+        conn: Соединение, удерживающее блокировку инициализации схемы
+        with_indexes: Построить индексы (иначе версия схемы не отмечается)
+    """
+    # Таблицы, функции и миграции одним скриптом в одной транзакции:
+    # при ошибке схема не остаётся наполовину созданной
+    async with conn.transaction():
+        await conn.execute(SCHEMA_SQL)
+    
+    # Без индексов схема не считается применённой: их построит
+    # create_indexes или следующая обычная инициализация
+    if with_indexes:
+        await _build_indexes(db_manager, conn)
+
+
+async def _build_indexes(db_manager: DatabaseManager, conn: asyncpg.Connection) -> None:
+    """
+    Построить индексы всех таблиц и записать версию схемы.
+    
+    Args:
+        db_manager: Менеджер подключения к базе данных
+        conn: Соединение, удерживающее блокировку инициализации схемы
+    """
+    # Индексы строятся CONCURRENTLY, не блокируя запись в таблицы.
+    # Существующие индексы читаем из каталога одним запросом; невалидные
+    # остатки прерванных построений удаляем
+    existing_indexes = set()
+    for row in await conn.fetch(SCHEMA_INDEXES_SQL, SCHEMA_TABLES):
+        if row["is_valid"]:
+            existing_indexes.add(row["index_name"])
+        else:
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {row['quoted_name']}")
+            logger.warning(f"Удалён невалидный индекс {row['quoted_name']}")
+    
+    # Выполняем только недостающие операции: CREATE для отсутствующих
+    # индексов и DROP для ещё существующих
+    pending_index_sqls = [
+        tuple(
+            index_sql for index_sql in index_sqls
+            if _is_index_sql_pending(index_sql, existing_indexes)
+        )
+        for index_sqls in SCHEMA_INDEX_SQLS
+    ]
+    
+    # CREATE INDEX CONCURRENTLY берёт SHARE UPDATE EXCLUSIVE на таблицу,
+    # поэтому индексы одной таблицы всё равно строятся по очереди —
+    # параллелим построение между таблицами
+    semaphore = asyncio.Semaphore(INDEX_BUILD_CONCURRENCY)
+    await asyncio.gather(*(
+        _create_indexes(db_manager, index_sqls, semaphore)
+        for index_sqls in pending_index_sqls
+        if index_sqls
+    ))
+    
+    # Версию записываем последней: если построение индексов прервётся,
+    # следующий запуск повторит инициализацию
+    await conn.execute(SCHEMA_VERSION_INSERT_SQL, SCHEMA_VERSION)
+
+
+async def _create_indexes(
+    db_manager: DatabaseManager,
+    index_sqls: tuple[str, ...],
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """
+    Построить индексы одной таблицы на отдельном соединении пула.
+    
+    Args:
+        db_manager: Менеджер подключения к базе данных
+        index_sqls: SQL создания индексов таблицы
+        semaphore: Ограничение числа одновременных построений
+    """
+    async with semaphore:
+        # SET LOCAL работает только в транзакции, а CONCURRENTLY — только
+        # вне её: задаём параметр на сессию и сбрасываем после построения.
+        # При ошибке сессию сбрасывает сам пул (RESET ALL при возврате соединения)
+        await db_manager.execute_many_ddl((
+            f"SET maintenance_work_mem = '{INDEX_BUILD_MAINTENANCE_WORK_MEM}'",
+            *index_sqls,
+            "RESET maintenance_work_mem",
+        ))
+
+
+def _is_index_sql_pending(index_sql: str, existing_indexes: set[str]) -> bool:
+    """
+    Проверить, нужно ли выполнять операцию над индексом.
+    
+    Args:
+        index_sql: CREATE INDEX ... IF NOT EXISTS или DROP INDEX ... IF EXISTS
+        existing_indexes: Имена существующих валидных индексов
+        
+    Returns:
+        True, если CREATE — для отсутствующего индекса, а DROP — для существующего
+    """
+    match = _INDEX_NAME_RE.search(index_sql)
+    if match is None:
+        return True
+    
+    exists = match.group(1) in existing_indexes
+    if index_sql.lstrip().upper().startswith("DROP"):
+        return exists
+    return not exists
+
+
+async def _is_schema_applied(conn: asyncpg.Connection) -> bool:
+    """
+    Проверить, применена ли текущая версия схемы.
+    
+    Args:
+        conn: Соединение с БД
+        
+    Returns:
+        True, если версия SCHEMA_VERSION уже записана в schema_meta
+    """
+    try:
+        return await conn.fetchval(SCHEMA_VERSION_EXISTS_SQL, SCHEMA_VERSION) is not None
+    except asyncpg.UndefinedTableError:
+        # Первый запуск: таблицы schema_meta ещё нет
+        return False
+
+
+__all__ = ["initialize_tables", "create_indexes"]
 
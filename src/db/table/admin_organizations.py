@@ -1,17 +1,13 @@
 """
 Таблица связей админов и организаций.
 """
-import logging
-
-from src.db.connection import DatabaseManager
-
-logger = logging.getLogger(__name__)
+from src.db.table.base import serial_to_identity_sql
 
 
 # Создание таблицы связей
 TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS admin_organizations (
-    id SERIAL PRIMARY KEY,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     admin_id UUID NOT NULL REFERENCES admins(id) ON DELETE CASCADE,
     organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
     created TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
@@ -20,62 +16,28 @@ CREATE TABLE IF NOT EXISTS admin_organizations (
 );
 """
 
+# Миграция: id таблиц, созданных ранее с SERIAL, — на BIGINT IDENTITY
+IDENTITY_MIGRATION_SQL = serial_to_identity_sql("admin_organizations")
+
 # Индекс для быстрого поиска по admin_id
 ADMIN_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_admin_organizations_admin_id ON admin_organizations(admin_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admin_organizations_admin_id ON admin_organizations(admin_id);
 """
 
 # Индекс для быстрого поиска по organization_id
 ORG_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_admin_organizations_org_id ON admin_organizations(organization_id);
-"""
-
-# Удаление триггера для связей
-DROP_TRIGGER_SQL = """
-DROP TRIGGER IF EXISTS update_admin_organizations_updated ON admin_organizations;
-"""
-
-# Создание триггера для автоматического обновления поля updated
-CREATE_TRIGGER_SQL = """
-CREATE TRIGGER update_admin_organizations_updated
-    BEFORE UPDATE ON admin_organizations
-    FOR EACH ROW
-    EXECUTE FUNCTION update_updated_column();
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admin_organizations_org_id ON admin_organizations(organization_id);
 """
 
 
-async def create_table(db_manager: DatabaseManager) -> None:
-    """
-    Создать таблицу связей админов и организаций в базе данных.
-    
-    Args:
-        db_manager: Менеджер подключения к базе данных
-    """
-    try:
-        logger.info("Создание таблицы admin_organizations...")
-        
-        # Создаем таблицу
-        await db_manager.execute(TABLE_SQL)
-        logger.debug("Таблица admin_organizations создана")
-        
-        # Создаем индексы (каждый отдельно)
-        await db_manager.execute(ADMIN_ID_INDEX_SQL)
-        logger.debug("Индекс idx_admin_organizations_admin_id создан")
-        
-        await db_manager.execute(ORG_ID_INDEX_SQL)
-        logger.debug("Индекс idx_admin_organizations_org_id создан")
-        
-        # Удаляем триггер, если существует (для идемпотентности)
-        await db_manager.execute(DROP_TRIGGER_SQL)
-        logger.debug("Старый триггер update_admin_organizations_updated удален (если существовал)")
-        
-        # Создаем триггер для автоматического обновления updated
-        await db_manager.execute(CREATE_TRIGGER_SQL)
-        logger.debug("Триггер update_admin_organizations_updated создан")
-        
-        logger.info("Таблица admin_organizations успешно создана со всеми индексами и триггерами")
-        
-    except Exception as e:
-        logger.error(f"Ошибка при создании таблицы admin_organizations: {e}", exc_info=True)
-        raise
+# Скрипт таблицы без индексов (входит в SCHEMA_SQL пакета)
+FULL_SQL = (
+    TABLE_SQL
+    + IDENTITY_MIGRATION_SQL
+)
 
+# Индексы таблицы (входят в SCHEMA_INDEX_SQLS пакета)
+INDEX_SQLS = (
+    ADMIN_ID_INDEX_SQL,
+    ORG_ID_INDEX_SQL,
+)
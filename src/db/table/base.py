@@ -2,14 +2,115 @@
 Базовые SQL-функции для таблиц.
 """
 
-# Функция для автоматического обновления поля updated
-UPDATE_TIMESTAMP_FUNCTION_SQL = """
-CREATE OR REPLACE FUNCTION update_updated_column()
-RETURNS TRIGGER AS $$
+# Удаление прежних триггеров обновления поля updated и их функции: поле
+# задаётся в UPDATE-запросах приложения. DROP TRIGGER берёт ACCESS EXCLUSIVE
+# на таблицу даже при IF EXISTS, поэтому триггеры удаляются только пока
+# существует их функция — после очистки блок ничего не блокирует
+DROP_LEGACY_UPDATE_TRIGGERS_SQL = """
+DO $$
 BEGIN
-    NEW.updated = NOW();
-    RETURN NEW;
-END;
-$$ LANGUAGE plpgsql;
+    IF to_regprocedure('update_updated_column()') IS NOT NULL THEN
+        DROP TRIGGER IF EXISTS update_admins_updated ON admins;
+        DROP TRIGGER IF EXISTS update_organizations_updated ON organizations;
+        DROP TRIGGER IF EXISTS update_admin_organizations_updated ON admin_organizations;
+        DROP TRIGGER IF EXISTS update_blacklist_persons_updated ON blacklist_persons;
+        DROP TRIGGER IF EXISTS update_blacklist_records_updated ON blacklist_records;
+        DROP FUNCTION update_updated_column();
+    END IF;
+END
+$$;
 """
 
+
+def serial_to_identity_sql(table: str) -> str:
+    """
+    Миграция колонки id таблицы, созданной ранее с SERIAL, на
+    BIGINT GENERATED ALWAYS AS IDENTITY.
+    
+    Нумерация продолжается с MAX(id) + 1; для уже переведённой
+    таблицы скрипт ничего не делает.
+    
+    Args:
+        table: Имя таблицы
+        
+    Returns:
+        SQL-скрипт миграции (DO-блок)
+    """
+    return f"""
+DO $$
+DECLARE
+    next_id BIGINT;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = '{table}'::regclass
+          AND attname = 'id'
+          AND attidentity = ''
+    ) THEN
+        SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM {table};
+        ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+        DROP SEQUENCE IF EXISTS {table}_id_seq;
+        ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT;
+        EXECUTE format(
+            'ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (START WITH %s)',
+            next_id
+        );
+    END IF;
+END
+$$;
+"""
+
+
+# Первые 64 бита hex-хеша как BIGINT — ключ компактных индексов частичного
+# поиска (8 байт вместо 64). Совпадение префикса перепроверяется полным хешем
+HASH_PREFIX64_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION hash_prefix64(TEXT)
+RETURNS BIGINT AS $$
+    SELECT ('x' || left($1, 16))::bit(64)::bigint;
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+"""
+
+
+# Таблица применённых версий схемы: версия — SHA-256 полного DDL-скрипта
+SCHEMA_META_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_meta (
+    version VARCHAR(64) PRIMARY KEY,
+    applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+"""
+
+# Проверка, применена ли версия схемы
+SCHEMA_VERSION_EXISTS_SQL = """
+SELECT 1 FROM schema_meta WHERE version = $1
+"""
+
+# Отметка о применённой версии схемы
+SCHEMA_VERSION_INSERT_SQL = """
+INSERT INTO schema_meta (version) VALUES ($1)
+ON CONFLICT (version) DO NOTHING
+"""
+
+# Все индексы указанных таблиц одним запросом к каталогу: существующие
+# валидные индексы не создаются повторно, а невалидные (остаются после
+# прерванного CREATE INDEX CONCURRENTLY) удаляются перед повторной попыткой
+SCHEMA_INDEXES_SQL = """
+SELECT index_class.relname AS index_name,
+       quote_ident(index_class.relname) AS quoted_name,
+       pg_index.indisvalid AS is_valid
+FROM pg_index
+JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid
+JOIN pg_class AS table_class ON table_class.oid = pg_index.indrelid
+JOIN pg_namespace ON pg_namespace.oid = table_class.relnamespace
+WHERE pg_namespace.nspname = current_schema()
+  AND table_class.relname = ANY($1::text[])
+"""
+
+# Advisory-блокировка инициализации схемы (на сессию соединения).
+# Попытка без ожидания: true, если блокировка получена
+SCHEMA_TRY_LOCK_SQL = """
+SELECT pg_try_advisory_lock($1)
+"""
+
+SCHEMA_UNLOCK_SQL = """
+SELECT pg_advisory_unlock($1)
+"""
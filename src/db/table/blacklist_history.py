@@ -1,11 +1,7 @@
 """
 Таблица истории изменений записей черного списка.
 """
-import logging
-
-from src.db.connection import DatabaseManager
-
-logger = logging.getLogger(__name__)
+from src.db.table.base import serial_to_identity_sql
 
 
 # Действия над записями
@@ -17,7 +13,7 @@ logger = logging.getLogger(__name__)
 # Создание таблицы истории
 TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS blacklist_history (
-    id SERIAL PRIMARY KEY,
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
     blacklist_record_id UUID NOT NULL REFERENCES blacklist_records(id) ON DELETE CASCADE,
     action VARCHAR(20) NOT NULL,
     changed_by_admin_id UUID NOT NULL REFERENCES admins(id) ON DELETE RESTRICT,
@@ -30,52 +26,50 @@ CREATE TABLE IF NOT EXISTS blacklist_history (
 );
 """
 
-# Индекс для поиска по записи черного списка
+# Миграция: id таблиц, созданных ранее с SERIAL, — на BIGINT IDENTITY
+IDENTITY_MIGRATION_SQL = serial_to_identity_sql("blacklist_history")
+
+# Индекс для истории записи черного списка: запросы берут последние
+# изменения (ORDER BY created DESC LIMIT), и составной индекс отдаёт их
+# сразу в нужном порядке — без сортировки всей истории записи
 RECORD_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_history_record_id 
-ON blacklist_history(blacklist_record_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_history_record_created 
+ON blacklist_history(blacklist_record_id, created DESC);
 """
 
-# Индекс для поиска по админу
+# Индекс для истории действий админа (последние изменения)
 ADMIN_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_history_admin_id 
-ON blacklist_history(changed_by_admin_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_history_admin_created 
+ON blacklist_history(changed_by_admin_id, created DESC);
+"""
+
+# Удаление прежних одноколоночных индексов (заменены составными)
+DROP_RECORD_ID_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_history_record_id;
+"""
+
+DROP_ADMIN_ID_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_history_admin_id;
 """
 
 # Индекс для поиска по дате
 CREATED_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_history_created 
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_history_created 
 ON blacklist_history(created);
 """
 
 
-async def create_table(db_manager: DatabaseManager) -> None:
-    """
-    Создать таблицу истории изменений в базе данных.
-    
-    Args:
-        db_manager: Менеджер подключения к базе данных
-    """
-    try:
-        logger.info("Создание таблицы blacklist_history...")
-        
-        # Создаем таблицу
-        await db_manager.execute(TABLE_SQL)
-        logger.debug("Таблица blacklist_history создана")
-        
-        # Создаем индексы
-        await db_manager.execute(RECORD_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_history_record_id создан")
-        
-        await db_manager.execute(ADMIN_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_history_admin_id создан")
-        
-        await db_manager.execute(CREATED_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_history_created создан")
-        
-        logger.info("Таблица blacklist_history успешно создана со всеми индексами")
-        
-    except Exception as e:
-        logger.error(f"Ошибка при создании таблицы blacklist_history: {e}", exc_info=True)
-        raise
+# Скрипт таблицы без индексов (входит в SCHEMA_SQL пакета)
+FULL_SQL = (
+    TABLE_SQL
+    + IDENTITY_MIGRATION_SQL
+)
 
+# Индексы таблицы (входят в SCHEMA_INDEX_SQLS пакета)
+INDEX_SQLS = (
+    RECORD_ID_INDEX_SQL,
+    ADMIN_ID_INDEX_SQL,
+    CREATED_INDEX_SQL,
+    DROP_RECORD_ID_INDEX_SQL,
+    DROP_ADMIN_ID_INDEX_SQL,
+)
@@ -2,11 +2,7 @@
 Таблица обезличенных пользователей черного списка.
 Хранит хеши персональных данных.
 """
-import logging
-
-from src.db.connection import DatabaseManager
-
-logger = logging.getLogger(__name__)
+from src.db.table.base import HASH_PREFIX64_FUNCTION_SQL
 
 
 # Создание таблицы обезличенных пользователей
@@ -17,18 +13,22 @@ CREATE TABLE IF NOT EXISTS blacklist_persons (
     organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
     
     -- Соль организации (копируется при создании для оптимизации поиска)
-    hash_salt VARCHAR(64) NOT NULL,
+    hash_salt VARCHAR(64) COLLATE "C" NOT NULL,
     
-    -- Хеши персональных данных (SHA-256, hex)
-    fio_hash VARCHAR(64) NOT NULL,
-    birthdate_hash VARCHAR(64) NOT NULL,
-    passport_hash VARCHAR(64) NOT NULL,
-    department_code_hash VARCHAR(64) NOT NULL,
-    phone_hash VARCHAR(64) NOT NULL,
+    -- Хеши персональных данных (SHA-256, hex).
+    -- COLLATE "C": сравнение в B-tree побайтовое, без правил локали
+    fio_hash VARCHAR(64) COLLATE "C" NOT NULL,
+    birthdate_hash VARCHAR(64) COLLATE "C" NOT NULL,
+    passport_hash VARCHAR(64) COLLATE "C" NOT NULL,
+    department_code_hash VARCHAR(64) COLLATE "C" NOT NULL,
+    phone_hash VARCHAR(64) COLLATE "C" NOT NULL,
     
     -- Дополнительные хеши для частичного поиска
-    surname_hash VARCHAR(64),
-    phone_last10_hash VARCHAR(64),
+    surname_hash VARCHAR(64) COLLATE "C",
+    phone_last10_hash VARCHAR(64) COLLATE "C",
+    
+    -- Хеш паспорта без соли организации (только pepper) для глобального поиска
+    passport_lookup_hash VARCHAR(64) COLLATE "C",
     
     created TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     updated TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
@@ -40,116 +40,125 @@ CREATE TABLE IF NOT EXISTS blacklist_persons (
 
 # Индекс для поиска по соли (оптимизация поиска)
 SALT_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_hash_salt 
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_hash_salt 
 ON blacklist_persons(hash_salt);
 """
 
-# Индекс для поиска по организации
-ORG_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_org_id 
-ON blacklist_persons(organization_id);
-"""
-
-# Индекс для поиска по хешу ФИО
-FIO_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_fio_hash 
-ON blacklist_persons(organization_id, fio_hash);
-"""
-
-# Индекс для поиска по хешу фамилии (частичный поиск)
+# Индекс для поиска по хешу фамилии (частичный поиск): по 64-битному
+# префиксу хеша — запись индекса ~12 байт вместо ~68
 SURNAME_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_surname_hash 
-ON blacklist_persons(organization_id, surname_hash);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_surname_prefix 
+ON blacklist_persons(organization_id, hash_prefix64(surname_hash));
 """
 
 # Индекс для поиска по хешу телефона
 PHONE_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_phone_hash 
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_phone_hash 
 ON blacklist_persons(organization_id, phone_hash);
 """
 
-# Индекс для поиска по последним 10 цифрам телефона
+# Индекс для поиска по последним 10 цифрам телефона (по 64-битному префиксу хеша)
 PHONE_LAST10_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_phone_last10_hash 
-ON blacklist_persons(organization_id, phone_last10_hash);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_phone_last10_prefix 
+ON blacklist_persons(organization_id, hash_prefix64(phone_last10_hash));
+"""
+
+# Удаление прежних индексов по полным хешам частичного поиска
+# (заменены индексами по префиксу)
+DROP_SURNAME_HASH_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_persons_surname_hash;
+"""
+
+DROP_PHONE_LAST10_HASH_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_persons_phone_last10_hash;
+"""
+
+# Удаление избыточных индексов (каждый лишний индекс — лишняя вставка
+# в B-tree и запись в WAL на каждый INSERT):
+# - (organization_id) и (organization_id, fio_hash) — префиксы индекса
+#   уникальности (organization_id, fio_hash, birthdate_hash, passport_hash);
+# - (organization_id, birthdate_hash) — запрос по дате рождения идёт только
+#   через OR с неиндексированным department_code_hash и индекс не использует
+DROP_ORG_ID_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_persons_org_id;
+"""
+
+DROP_FIO_HASH_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_persons_fio_hash;
+"""
+
+DROP_BIRTHDATE_HASH_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_persons_birthdate_hash;
 """
 
 # Индекс для поиска по хешу паспорта
 PASSPORT_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_passport_hash 
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_passport_hash 
 ON blacklist_persons(organization_id, passport_hash);
 """
 
-# Индекс для поиска по хешу даты рождения
-BIRTHDATE_HASH_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_persons_birthdate_hash 
-ON blacklist_persons(organization_id, birthdate_hash);
+# Миграция: колонка глобального хеша паспорта для таблиц, созданных ранее
+PASSPORT_LOOKUP_HASH_COLUMN_SQL = """
+ALTER TABLE blacklist_persons 
+ADD COLUMN IF NOT EXISTS passport_lookup_hash VARCHAR(64) COLLATE "C";
 """
 
-# Удаление триггера
-DROP_TRIGGER_SQL = """
-DROP TRIGGER IF EXISTS update_blacklist_persons_updated ON blacklist_persons;
+# Миграция: перевод хеш-колонок таблиц, созданных ранее, на COLLATE "C".
+# Значения (hex) не меняются; индексы по колонкам перестраиваются один раз
+# одним ALTER TABLE. Уже переведённые колонки пропускаются
+HASH_COLLATION_MIGRATION_SQL = """
+DO $$
+DECLARE
+    alter_clauses TEXT;
+BEGIN
+    SELECT string_agg(
+        format('ALTER COLUMN %I TYPE VARCHAR(64) COLLATE "C"', attname), ', '
+    )
+    INTO alter_clauses
+    FROM pg_attribute
+    WHERE attrelid = 'blacklist_persons'::regclass
+      AND attname IN (
+          'hash_salt', 'fio_hash', 'birthdate_hash', 'passport_hash',
+          'department_code_hash', 'phone_hash', 'surname_hash',
+          'phone_last10_hash', 'passport_lookup_hash'
+      )
+      AND attcollation NOT IN (SELECT oid FROM pg_collation WHERE collname = 'C');
+      
+    IF alter_clauses IS NOT NULL THEN
+        EXECUTE 'ALTER TABLE blacklist_persons ' || alter_clauses;
+    END IF;
+END
+$$;
 """
 
-# Создание триггера для автоматического обновления поля updated
-CREATE_TRIGGER_SQL = """
-CREATE TRIGGER update_blacklist_persons_updated
-    BEFORE UPDATE ON blacklist_persons
-    FOR EACH ROW
-    EXECUTE FUNCTION update_updated_column();
+# Индекс для глобального поиска по паспорту (без перебора солей организаций)
+PASSPORT_LOOKUP_HASH_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_persons_passport_lookup_hash 
+ON blacklist_persons(passport_lookup_hash);
 """
 
 
-async def create_table(db_manager: DatabaseManager) -> None:
-    """
-    Создать таблицу обезличенных пользователей в базе данных.
-    
-    Args:
-        db_manager: Менеджер подключения к базе данных
-    """
-    try:
-        logger.info("Создание таблицы blacklist_persons...")
-        
-        # Создаем таблицу
-        await db_manager.execute(TABLE_SQL)
-        logger.debug("Таблица blacklist_persons создана")
-        
-        # Создаем индексы
-        await db_manager.execute(ORG_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_org_id создан")
-        
-        await db_manager.execute(SALT_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_hash_salt создан")
-        
-        await db_manager.execute(FIO_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_fio_hash создан")
-        
-        await db_manager.execute(SURNAME_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_surname_hash создан")
-        
-        await db_manager.execute(PHONE_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_phone_hash создан")
-        
-        await db_manager.execute(PHONE_LAST10_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_phone_last10_hash создан")
-        
-        await db_manager.execute(PASSPORT_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_passport_hash создан")
-        
-        await db_manager.execute(BIRTHDATE_HASH_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_persons_birthdate_hash создан")
-        
-        # Удаляем триггер, если существует (для идемпотентности)
-        await db_manager.execute(DROP_TRIGGER_SQL)
-        logger.debug("Старый триггер update_blacklist_persons_updated удален (если существовал)")
-        
-        # Создаем триггер для автоматического обновления updated
-        await db_manager.execute(CREATE_TRIGGER_SQL)
-        logger.debug("Триггер update_blacklist_persons_updated создан")
-        
-        logger.info("Таблица blacklist_persons успешно создана со всеми индексами и триггерами")
-        
-    except Exception as e:
-        logger.error(f"Ошибка при создании таблицы blacklist_persons: {e}", exc_info=True)
-        raise
-
+# Скрипт таблицы без индексов (входит в SCHEMA_SQL пакета).
+# Функция hash_prefix64 нужна индексам частичного поиска из INDEX_SQLS
+FULL_SQL = (
+    HASH_PREFIX64_FUNCTION_SQL
+    + TABLE_SQL
+    + PASSPORT_LOOKUP_HASH_COLUMN_SQL
+    + HASH_COLLATION_MIGRATION_SQL
+)
+
+# Индексы таблицы (входят в SCHEMA_INDEX_SQLS пакета).
+# Замещённые индексы удаляются (тоже CONCURRENTLY) после создания новых
+INDEX_SQLS = (
+    SALT_INDEX_SQL,
+    SURNAME_HASH_INDEX_SQL,
+    PHONE_HASH_INDEX_SQL,
+    PHONE_LAST10_HASH_INDEX_SQL,
+    PASSPORT_HASH_INDEX_SQL,
+    PASSPORT_LOOKUP_HASH_INDEX_SQL,
+    DROP_SURNAME_HASH_INDEX_SQL,
+    DROP_PHONE_LAST10_HASH_INDEX_SQL,
+    DROP_ORG_ID_INDEX_SQL,
+    DROP_FIO_HASH_INDEX_SQL,
+    DROP_BIRTHDATE_HASH_INDEX_SQL,
+)
@@ -2,12 +2,6 @@
 Таблица записей черного списка.
 Связывает обезличенного пользователя с причиной добавления в ЧС.
 """
-import logging
-
-from src.db.connection import DatabaseManager
-
-logger = logging.getLogger(__name__)
-
 
 # Создание таблицы записей черного списка
 TABLE_SQL = """
@@ -26,76 +20,39 @@ CREATE TABLE IF NOT EXISTS blacklist_records (
 
 # Индекс для поиска по пользователю
 PERSON_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_records_person_id ON blacklist_records(person_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_records_person_id ON blacklist_records(person_id);
 """
 
-# Индекс для поиска по статусу
-STATUS_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_records_status ON blacklist_records(status);
-"""
 
 # Индекс для поиска по админу, добавившему запись
 ADMIN_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_records_admin_id ON blacklist_records(added_by_admin_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_records_admin_id ON blacklist_records(added_by_admin_id);
 """
 
-# Индекс для поиска по организации
-ORG_ID_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_blacklist_records_org_id ON blacklist_records(organization_id);
+# Индекс для поиска по организации и статусу. Статус фильтруется только
+# вместе с организацией или пользователем, поэтому отдельный индекс по
+# статусу (несколько значений на всю таблицу) не нужен; поиск только по
+# организации использует префикс этого индекса
+ORG_STATUS_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blacklist_records_org_status 
+ON blacklist_records(organization_id, status);
 """
 
-# Удаление триггера
-DROP_TRIGGER_SQL = """
-DROP TRIGGER IF EXISTS update_blacklist_records_updated ON blacklist_records;
+# Удаление прежних индексов по статусу и по организации (заменены составным)
+DROP_STATUS_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_records_status;
 """
 
-# Создание триггера для автоматического обновления поля updated
-CREATE_TRIGGER_SQL = """
-CREATE TRIGGER update_blacklist_records_updated
-    BEFORE UPDATE ON blacklist_records
-    FOR EACH ROW
-    EXECUTE FUNCTION update_updated_column();
+DROP_ORG_ID_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS idx_blacklist_records_org_id;
 """
 
 
-async def create_table(db_manager: DatabaseManager) -> None:
-    """
-    Создать таблицу записей черного списка в базе данных.
-    
-    Args:
-        db_manager: Менеджер подключения к базе данных
-    """
-    try:
-        logger.info("Создание таблицы blacklist_records...")
-        
-        # Создаем таблицу
-        await db_manager.execute(TABLE_SQL)
-        logger.debug("Таблица blacklist_records создана")
-        
-        # Создаем индексы
-        await db_manager.execute(PERSON_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_records_person_id создан")
-        
-        await db_manager.execute(STATUS_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_records_status создан")
-        
-        await db_manager.execute(ADMIN_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_records_admin_id создан")
-        
-        await db_manager.execute(ORG_ID_INDEX_SQL)
-        logger.debug("Индекс idx_blacklist_records_org_id создан")
-        
-        # Удаляем триггер, если существует (для идемпотентности)
-        await db_manager.execute(DROP_TRIGGER_SQL)
-        logger.debug("Старый триггер update_blacklist_records_updated удален (если существовал)")
-        
-        # Создаем триггер для автоматического обновления updated
-        await db_manager.execute(CREATE_TRIGGER_SQL)
-        logger.debug("Триггер update_blacklist_records_updated создан")
-        
-        logger.info("Таблица blacklist_records успешно создана со всеми индексами и триггерами")
-        
-    except Exception as e:
-        logger.error(f"Ошибка при создании таблицы blacklist_records: {e}", exc_info=True)
-        raise
-
+# Индексы таблицы (входят в SCHEMA_INDEX_SQLS пакета)
+INDEX_SQLS = (
+    PERSON_ID_INDEX_SQL,
+    ADMIN_ID_INDEX_SQL,
+    ORG_STATUS_INDEX_SQL,
+    DROP_STATUS_INDEX_SQL,
+    DROP_ORG_ID_INDEX_SQL,
+)